@@ -1,77 +1,88 @@
 import os
+from dataclasses import dataclass
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class Config:
+# Values are read from the environment once, at import. Frozen + slots:
+# nothing can reassign a setting at runtime, and attribute reads are slot
+# lookups instead of class-dict lookups.
+@dataclass(frozen=True, slots=True)
+class _Config:
     # --- Mode selection ---
-    VOICE_AGENT_MODE = os.getenv("VOICE_AGENT_MODE", "true").lower() in ("true", "1", "yes")
+    VOICE_AGENT_MODE: bool = os.getenv("VOICE_AGENT_MODE", "true").lower() in ("true", "1", "yes")
 
     # --- Legacy provider selection (used when VOICE_AGENT_MODE=false) ---
-    STT_PROVIDER = os.getenv("STT_PROVIDER", "openai").lower()
-    LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai").lower()
-    TTS_PROVIDER = os.getenv("TTS_PROVIDER", "openai").lower()
+    STT_PROVIDER: str = os.getenv("STT_PROVIDER", "openai").lower()
+    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai").lower()
+    TTS_PROVIDER: str = os.getenv("TTS_PROVIDER", "openai").lower()
 
     # --- OpenAI (legacy mode or BYOM for Voice Agent) ---
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_LLM_MODEL = os.getenv("OPENAI_LLM_MODEL", "gpt-4o-mini")
-    OPENAI_TTS_VOICE = os.getenv("OPENAI_TTS_VOICE", "nova")
+    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_LLM_MODEL: str = os.getenv("OPENAI_LLM_MODEL", "gpt-4o-mini")
+    OPENAI_TTS_VOICE: str = os.getenv("OPENAI_TTS_VOICE", "nova")
 
     # --- Gemini (legacy mode) ---
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-    GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
 
     # --- Deepgram Voice Agent API ---
-    DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY", "")
-    DEEPGRAM_STT_MODEL = os.getenv("DEEPGRAM_STT_MODEL", "flux-general-en")
-    DEEPGRAM_TTS_MODEL = os.getenv("DEEPGRAM_TTS_MODEL", "aura-2-iris-en")
-    DEEPGRAM_INPUT_SAMPLE_RATE = int(os.getenv("DEEPGRAM_INPUT_SAMPLE_RATE", "16000"))
-    DEEPGRAM_TTS_SAMPLE_RATE = int(os.getenv("DEEPGRAM_TTS_SAMPLE_RATE", "16000"))
-    DEEPGRAM_LLM_PROVIDER = os.getenv("DEEPGRAM_LLM_PROVIDER", "open_ai")
-    DEEPGRAM_LLM_MODEL = os.getenv("DEEPGRAM_LLM_MODEL", "gpt-4o-mini")
+    DEEPGRAM_API_KEY: str = os.getenv("DEEPGRAM_API_KEY", "")
+    DEEPGRAM_STT_MODEL: str = os.getenv("DEEPGRAM_STT_MODEL", "flux-general-en")
+    DEEPGRAM_TTS_MODEL: str = os.getenv("DEEPGRAM_TTS_MODEL", "aura-2-iris-en")
+    DEEPGRAM_INPUT_SAMPLE_RATE: int = int(os.getenv("DEEPGRAM_INPUT_SAMPLE_RATE", "16000"))
+    DEEPGRAM_TTS_SAMPLE_RATE: int = int(os.getenv("DEEPGRAM_TTS_SAMPLE_RATE", "16000"))
+    DEEPGRAM_LLM_PROVIDER: str = os.getenv("DEEPGRAM_LLM_PROVIDER", "open_ai")
+    DEEPGRAM_LLM_MODEL: str = os.getenv("DEEPGRAM_LLM_MODEL", "gpt-4o-mini")
 
     # --- Flux turn detection tuning ---
     # eot_threshold: confidence needed to finalize turn (0.5-0.9, default 0.7)
     #   Higher = waits longer for certainty, fewer false cuts
     # eot_timeout_ms: max silence before forcing turn end (default 5000)
     #   Lower = snappier responses on ambiguous pauses
-    DEEPGRAM_EOT_THRESHOLD = float(os.getenv("DEEPGRAM_EOT_THRESHOLD", "0.8"))
-    DEEPGRAM_EOT_TIMEOUT_MS = int(os.getenv("DEEPGRAM_EOT_TIMEOUT_MS", "3000"))
+    DEEPGRAM_EOT_THRESHOLD: float = float(os.getenv("DEEPGRAM_EOT_THRESHOLD", "0.8"))
+    DEEPGRAM_EOT_TIMEOUT_MS: int = int(os.getenv("DEEPGRAM_EOT_TIMEOUT_MS", "3000"))
 
     # --- Companion personality ---
-    COMPANION_NAME = os.getenv("COMPANION_NAME", "Piglet")
-    SYSTEM_PROMPT = os.getenv("SYSTEM_PROMPT", "")
+    COMPANION_NAME: str = os.getenv("COMPANION_NAME", "Piglet")
+    SYSTEM_PROMPT: str = os.getenv("SYSTEM_PROMPT", "")
+
+    CHAT_HISTORY_RESET_TIME: int = int(os.getenv("CHAT_HISTORY_RESET_TIME", "300"))
+    # DEBUG adds state transitions and per-turn timing detail
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
 
-    CHAT_HISTORY_RESET_TIME = int(os.getenv("CHAT_HISTORY_RESET_TIME", "300"))
+    # --- Web search semantic cache (needs sentence-transformers) ---
+    SEMANTIC_CACHE: bool = os.getenv("SEMANTIC_CACHE", "false").lower() in ("true", "1", "yes")
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
 
     # --- Audio hardware ---
-    INITIAL_VOLUME_LEVEL = int(os.getenv("INITIAL_VOLUME_LEVEL", "127"))
-    SOUND_CARD_NAME = os.getenv("SOUND_CARD_NAME", "wm8960soundcard")
+    INITIAL_VOLUME_LEVEL: int = int(os.getenv("INITIAL_VOLUME_LEVEL", "127"))
+    SOUND_CARD_NAME: str = os.getenv("SOUND_CARD_NAME", "wm8960soundcard")
 
     # --- Paths ---
-    CUSTOM_FONT_PATH = os.getenv("CUSTOM_FONT_PATH", "")
-    MUSIC_DIR = os.getenv("MUSIC_DIR", os.path.join(os.path.dirname(__file__), "assets", "music"))
-    IDLE_IMAGE_PATH = os.getenv("IDLE_IMAGE_PATH", os.path.join(os.path.dirname(__file__), "assets", "images", "idle.png"))
-    PHOTOS_DIR = os.getenv("PHOTOS_DIR", os.path.join(os.path.dirname(__file__), "photos"))
+    CUSTOM_FONT_PATH: str = os.getenv("CUSTOM_FONT_PATH", "")
+    MUSIC_DIR: str = os.getenv("MUSIC_DIR", os.path.join(os.path.dirname(__file__), "assets", "music"))
+    IDLE_IMAGE_PATH: str = os.getenv("IDLE_IMAGE_PATH", os.path.join(os.path.dirname(__file__), "assets", "images", "idle.png"))
+    PHOTOS_DIR: str = os.getenv("PHOTOS_DIR", os.path.join(os.path.dirname(__file__), "photos"))
 
-    @classmethod
-    def validate(cls):
+    def validate(self):
         errors = []
 
-        if cls.VOICE_AGENT_MODE:
-            if not cls.DEEPGRAM_API_KEY:
+        if self.VOICE_AGENT_MODE:
+            if not self.DEEPGRAM_API_KEY:
                 errors.append("DEEPGRAM_API_KEY is required when VOICE_AGENT_MODE=true")
-            if cls.DEEPGRAM_LLM_PROVIDER == "open_ai" and not cls.OPENAI_API_KEY:
+            if self.DEEPGRAM_LLM_PROVIDER == "open_ai" and not self.OPENAI_API_KEY:
                 errors.append("OPENAI_API_KEY is required when DEEPGRAM_LLM_PROVIDER=open_ai")
         else:
-            if cls.STT_PROVIDER == "openai" and not cls.OPENAI_API_KEY:
+            if self.STT_PROVIDER == "openai" and not self.OPENAI_API_KEY:
                 errors.append("OPENAI_API_KEY is required when STT_PROVIDER=openai")
-            if cls.LLM_PROVIDER == "openai" and not cls.OPENAI_API_KEY:
+            if self.LLM_PROVIDER == "openai" and not self.OPENAI_API_KEY:
                 errors.append("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-            if cls.TTS_PROVIDER == "openai" and not cls.OPENAI_API_KEY:
+            if self.TTS_PROVIDER == "openai" and not self.OPENAI_API_KEY:
                 errors.append("OPENAI_API_KEY is required when TTS_PROVIDER=openai")
-            if cls.LLM_PROVIDER == "gemini" and not cls.GEMINI_API_KEY:
+            if self.LLM_PROVIDER == "gemini" and not self.GEMINI_API_KEY:
                 errors.append("GEMINI_API_KEY is required when LLM_PROVIDER=gemini")
 
         if errors:
@@ -80,3 +91,5 @@ class Config:
             return False
         return True
 
+
+Config = _Config()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from config import Config
 
 DEFAULT_SYSTEM_PROMPT = """You are {name}, a cute, chubby pig companion! You live inside a small device with a tiny screen, a speaker, and a button. You belong to a wonderful person named Evelyn and your job is to be cheerful, interested inher life, her family in Singapore as well as her hobbies like creating stainglass artwork or knitting.
@@ -68,9 +70,11 @@ Important rules:
 - Today's date is available to you -- use it for time-aware greetings and context"""
 
 
+@lru_cache(maxsize=4)
+def _render(custom, name):
+    return custom or DEFAULT_SYSTEM_PROMPT.format(name=name)
+
+
 def get_system_prompt():
-    custom = Config.SYSTEM_PROMPT
-    if custom:
-        return custom
-    name = Config.COMPANION_NAME
-    return DEFAULT_SYSTEM_PROMPT.format(name=name)
+    # Keyed on the config values, so a changed name/prompt is picked up
+    return _render(Config.SYSTEM_PROMPT, Config.COMPANION_NAME)
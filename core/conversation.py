@@ -6,6 +6,7 @@ from core.companion import get_system_prompt
 class Conversation:
     def __init__(self):
         self.messages = []
+        self._snapshot = None  # tuple of messages, rebuilt only after a change
         self.last_activity = time.time()
         self._init_system()
 
@@ -13,19 +14,30 @@ class Conversation:
         self.messages = [
             {"role": "system", "content": get_system_prompt()}
         ]
+        self._snapshot = None
 
     def add_user_message(self, text):
+        """Append the user's turn and return the message snapshot to send."""
         self._check_reset()
         self.messages.append({"role": "user", "content": text})
+        self._snapshot = None
         self.last_activity = time.time()
+        return self._snap()
 
     def add_assistant_message(self, text):
         self.messages.append({"role": "assistant", "content": text})
+        self._snapshot = None
         self.last_activity = time.time()
 
     def get_messages(self):
+        """Immutable snapshot of the history; reused until it changes."""
         self._check_reset()
-        return list(self.messages)
+        return self._snap()
+
+    def _snap(self):
+        if self._snapshot is None:
+            self._snapshot = tuple(self.messages)
+        return self._snapshot
 
     def _check_reset(self):
         elapsed = time.time() - self.last_activity
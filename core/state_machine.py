@@ -1,14 +1,37 @@
+import asyncio
+import logging
 import os
+import queue
+import re
 import time
 import threading
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from config import Config
 from core.conversation import Conversation
+from features.tools import execute_tool
+from services import llm, stt, tts
+from services.audio import (
+    set_capture_volume,
+    set_volume,
+    start_recording,
+    stop_playback,
+    stop_recording,
+)
+from services.voice_agent import VoiceAgent
 from ui.renderer import display_state, RenderThread
-from ui.utils import ColorUtils
+from ui.utils import ColorUtils, EmojiUtils
 from ui.framework import TURN_BASES
 
+logger = logging.getLogger(__name__)
+
+_TMPDIR = tempfile.gettempdir()
+_PID = os.getpid()
+_END_OF_SPEECH = object()
+
 # LED colors derived from the turn palette
 TURN_RGB = {
     "green":  TURN_BASES["green"],    # (0, 210, 80)
@@ -19,8 +42,88 @@ TURN_RGB = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class DisplayFrame:
+    """Fixed display/LED fields applied when entering a state."""
+    status: str
+    emoji: str
+    rgb: tuple
+    turn: str = None
+    text: str = None
+    scroll_speed: int = None
+
+
+def _turn_frame(status, emoji, turn, text=None, scroll_speed=0):
+    return DisplayFrame(status, emoji, TURN_RGB[turn], turn, text, scroll_speed)
+
+
+# Legacy state entry frames, built once
+_FRAMES = {
+    "idle": _turn_frame("idle", "🐷", "sleep", text="Hold button to talk!"),
+    "listening": _turn_frame("listening", "🎤", "green", text="I'm listening..."),
+    "thinking": _turn_frame("thinking", "🤔", "amber", text="Let me think..."),
+    "speaking": _turn_frame("answering", "🐷", "red", scroll_speed=3),
+    "game": DisplayFrame("playing", "🎮", (255, 0, 255)),
+    "music": DisplayFrame("playing music", "🎵", (255, 105, 180), scroll_speed=0),
+}
+
+# Voice Agent state entry frames
+_AGENT_FRAMES = {
+    "idle": _turn_frame(
+        "sleeping", "🐷", "sleep",
+        text=f"Hold button to talk to {Config.COMPANION_NAME}!",
+    ),
+    "active": _turn_frame("ready", "🐷", "red", text=f"{Config.COMPANION_NAME} is here!"),
+    "game": _FRAMES["game"],
+    "music": _FRAMES["music"],
+}
+
+# Voice Agent in-conversation updates; None fields leave the display as is
+_AGENT_LISTENING = _turn_frame("listening", "🎤", "green", text="I'm listening...")
+_AGENT_THINKING = _turn_frame(
+    "thinking", "🤔", "amber", text="Let me think...", scroll_speed=None
+)
+_AGENT_TALKING = _turn_frame("talking", None, "red", scroll_speed=None)
+_AGENT_READY = _turn_frame("ready", None, "red", scroll_speed=None)
+_AGENT_UNPAUSED = _turn_frame(
+    "ready", "🐷", "red", text=f"{Config.COMPANION_NAME} is back!", scroll_speed=None
+)
+_AGENT_PAUSED = _turn_frame(
+    "paused", "⏸️", "paused", text="Paused — tap to resume", scroll_speed=None
+)
+
+
 # ---------- VOICE AGENT MODE ----------
 
+# States in which agent events are handled / local media owns the screen
+_AGENT_EVENT_STATES = frozenset(("active", "music", "game"))
+_MEDIA_STATES = frozenset(("game", "music"))
+
+class _LoopTimer:
+    """call_later handle that can be armed and cancelled from any thread."""
+
+    __slots__ = ("_loop", "_handle", "_cancelled")
+
+    def __init__(self, loop, delay, fn):
+        self._loop = loop
+        self._handle = None
+        self._cancelled = False
+        loop.call_soon_threadsafe(self._arm, delay, fn)
+
+    def _arm(self, delay, fn):
+        if not self._cancelled:
+            self._handle = self._loop.call_later(delay, self._fire, fn)
+
+    def _fire(self, fn):
+        if not self._cancelled:
+            fn()
+
+    def cancel(self):
+        self._cancelled = True
+        if self._handle is not None:
+            self._loop.call_soon_threadsafe(self._handle.cancel)
+
+
 class VoiceAgentStateMachine:
     """State machine for Deepgram Voice Agent mode.
 
@@ -47,16 +150,32 @@ class VoiceAgentStateMachine:
 
     Threading safety:
         All state mutations and timer callbacks are guarded by self._lock.
-        Every timer callback captures an epoch at creation time and bails
-        if the epoch has changed (meaning a state transition happened).
+        Timers run on one asyncio loop thread (no thread per timer). Every
+        timer callback captures an epoch at creation time and bails if the
+        epoch has changed (meaning a state transition happened).
     """
 
     BYE_WORDS = {"bye", "goodbye", "ok bye", "good bye", "see ya", "see you", "bye bye"}
+    # Transcript ends with a bye word; longest alternatives first
+    _BYE_RE = re.compile(
+        r"(?:^|\s)(?:%s)[.!?,]*\s*$"
+        % "|".join(map(re.escape, sorted(BYE_WORDS, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
     IDLE_TIMEOUT_SEC = 30
     IDLE_SLEEP_SEC = 120     # 2 min idle → deep sleep
     DOUBLE_CLICK_SEC = 0.4
     RESPONSE_DELAY_SEC = 0.5
     TAP_THRESHOLD_SEC = 0.3   # press shorter than this = tap (not push-to-talk)
+    RECONNECT_DELAY_SEC = 2
+    TRANSCRIPT_FLUSH_SEC = 0.1
+    GOODBYE_SEC = 3           # time for the agent to speak its goodbye
+    # Agent events still handled while paused
+    _PAUSED_EVENTS = frozenset(("error", "warning", "disconnected", "function_call"))
+    # Past this backlog, status-only events are dropped so a stalled loop
+    # can't grow the queue; transcripts, errors and tool calls always go in
+    _AGENT_EVENT_BACKLOG = 64
+    _DROPPABLE_EVENTS = frozenset(("user_speaking", "agent_thinking", "agent_speaking"))
 
     _RGB_MIN_INTERVAL = 0.4
 
@@ -73,15 +192,61 @@ class VoiceAgentStateMachine:
         self._holding = False
         self._last_click_time = 0
         self._current_rgb = None
-        self._last_rgb_time = 0
+        self._pending_rgb = None
+        self._rgb_pump_armed = False
+        self._last_rgb_time = 0.0
 
         self._paused = False
 
-        # Timers (all guarded by epoch)
+        # Assistant text seen so far this turn and its latest emoji
+        self._assistant_text = ""
+        self._assistant_emoji = ""
+        self._pending_transcript = ""
+        self._flashed_this_turn = False
+
+        self._flashing = False    # only touched on the loop thread
+        self._agent_events = deque()  # receiver thread -> loop
+
+        # Timers (all guarded by epoch), scheduled on one long-lived loop
         self._idle_timer = None
+        self._idle_deadline = 0.0
         self._single_click_timer = None
+        self._transcript_timer = None
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever, name="sm-loop", daemon=True
+        ).start()
+        # Blocking agent connect/disconnect run here, not on fresh threads
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sm-io")
+
+        # State -> enter handler, bound once instead of per transition
+        self._state_handlers = {
+            "idle": self._enter_idle,
+            "active": self._enter_active,
+            "game": self._enter_game,
+            "music": self._enter_music,
+            "asleep": self._enter_asleep,
+        }
+        # Agent event -> handler; "ready"/"connected" need no handling
+        self._event_handlers = {
+            "user_speaking": self._on_user_speaking,
+            "agent_thinking": self._on_agent_thinking,
+            "agent_speaking": self._on_agent_speaking,
+            "conversation_text": self._on_conversation_text,
+            "agent_audio_done": self._on_agent_audio_done,
+            "function_call": self._on_function_call,
+            "error": self._on_error,
+            "disconnected": self._on_disconnected,
+        }
+        # State -> (press, release) bound after the enter handler runs;
+        # game binds its own callbacks
+        self._buttons = {
+            "idle": (self._on_button_press_idle, self._on_button_release_idle),
+            "active": (self._on_button_press_active, self._on_button_release_active),
+            "music": (self._on_button_press_active, self._on_button_release_active),
+            "asleep": (self._on_button_press_asleep, None),
+        }
 
-        from services.audio import set_volume, set_capture_volume
         set_volume(100)
         set_capture_volume(100)
 
@@ -90,7 +255,7 @@ class VoiceAgentStateMachine:
     # --- Timer helpers (epoch-safe) ---
 
     def _start_timer(self, seconds, callback):
-        """Create a daemon timer that checks epoch before firing."""
+        """Schedule callback on the loop; it checks epoch before firing."""
         my_epoch = self._epoch
 
         def _guarded():
@@ -99,10 +264,7 @@ class VoiceAgentStateMachine:
                     return
                 callback()
 
-        t = threading.Timer(seconds, _guarded)
-        t.daemon = True
-        t.start()
-        return t
+        return _LoopTimer(self._loop, seconds, _guarded)
 
     def _cancel_timer(self, attr_name):
         """Cancel a timer stored in self.<attr_name>."""
@@ -112,23 +274,15 @@ class VoiceAgentStateMachine:
             setattr(self, attr_name, None)
 
     def _cancel_all_timers(self):
-        for name in ("_idle_timer",):
+        for name in ("_idle_timer", "_transcript_timer"):
             self._cancel_timer(name)
 
     # --- Agent lifecycle ---
 
     def start_agent(self):
-        from services.voice_agent import VoiceAgent
         self._paused = False
 
-        self._update_display(
-            status="listening",
-            emoji="🎤",
-            text="I'm listening...",
-            turn="green",
-            scroll_speed=0,
-            image_path="",
-        )
+        self._apply_frame(_AGENT_LISTENING, image_path="")
 
         self._agent = VoiceAgent(on_event=self._on_agent_event)
         self._agent.set_state_machine(self)
@@ -151,28 +305,58 @@ class VoiceAgentStateMachine:
                     self._agent.suppress_output_for(self.RESPONSE_DELAY_SEC)
                 self._set_state("active")
 
-        threading.Thread(target=do_connect, daemon=True).start()
+        self._submit(do_connect)
 
     def _end_conversation(self, reason=""):
-        with self._lock:
-            print(f"[State] Ending conversation: {reason}")
-            agent = self._agent
-            self._agent = None
-        if agent:
-            if reason != "timeout":
+        """Ask for a goodbye, then disconnect once it has had time to play.
+
+        Caller holds self._lock. Nothing here blocks: the goodbye is sent
+        from an I/O worker, and the disconnect is scheduled on the loop
+        rather than slept for.
+        """
+        logger.info("[State] Ending conversation: %s", reason)
+        agent = self._agent
+        self._agent = None
+        if agent and reason != "timeout":
+            def say_goodbye():
                 agent.inject_user_message(
                     "[SYSTEM: The conversation is ending. Say a brief, warm goodbye "
                     "in 1 sentence. Be sweet about it.]"
                 )
-                time.sleep(3)
-            agent.disconnect()
-        with self._lock:
-            self._set_state("asleep")
+                _LoopTimer(self._loop, self.GOODBYE_SEC, lambda: self._disconnect(agent))
+            self._submit(say_goodbye)
+        else:
+            self._disconnect(agent)
+
+    def _disconnect(self, agent):
+        """Disconnect off the loop, then deep sleep unless a new agent started.
+
+        agent.disconnect() blocks on subprocess exits and the socket close.
+        """
+        def _run():
+            if agent:
+                agent.disconnect()
+            with self._lock:
+                if self._agent is None:
+                    self._set_state("asleep")
+
+        self._submit(_run)
+
+    def _submit(self, fn, *args):
+        """Run fn on the I/O workers, logging anything it raises."""
+        def _run():
+            try:
+                return fn(*args)
+            except Exception as e:
+                logger.error("[State] %s failed: %s", fn.__name__, e)
+        return self._executor.submit(_run)
 
     def stop(self):
         with self._lock:
             self.running = False
             self._cancel_all_timers()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._executor.shutdown(wait=False, cancel_futures=True)
         if self._agent:
             self._agent.disconnect()
         if self._active_game:
@@ -188,28 +372,31 @@ class VoiceAgentStateMachine:
     # --- Activity tracking & idle timeout ---
 
     def _touch_activity(self):
-        self._restart_idle_timer()
+        """Push the idle deadline out; arms the idle check only if unarmed."""
+        self._idle_deadline = time.monotonic() + self.IDLE_TIMEOUT_SEC
+        if self._idle_timer is None:
+            self._idle_timer = self._start_timer(
+                self.IDLE_TIMEOUT_SEC, self._check_idle
+            )
 
-    def _restart_idle_timer(self):
-        self._cancel_timer("_idle_timer")
-        self._idle_timer = self._start_timer(
-            self.IDLE_TIMEOUT_SEC, self._on_idle_timeout
-        )
+    def _check_idle(self):
+        """Fires at the earliest possible deadline; re-arms if it moved."""
+        self._idle_timer = None
+        remaining = self._idle_deadline - time.monotonic()
+        if remaining > 0:
+            self._idle_timer = self._start_timer(remaining, self._check_idle)
+            return
+        self._on_idle_timeout()
 
     def _on_idle_timeout(self):
         if self.state == "active":
-            print(f"[State] No activity for {self.IDLE_TIMEOUT_SEC}s")
-            threading.Thread(
-                target=self._end_conversation, args=("timeout",), daemon=True
-            ).start()
+            logger.info("[State] No activity for %ss", self.IDLE_TIMEOUT_SEC)
+            self._end_conversation("timeout")
 
     # --- Bye detection ---
 
     def _check_for_bye(self, text):
-        if not text:
-            return False
-        cleaned = text.lower().strip().rstrip(".!?,")
-        return any(cleaned == bye or cleaned.endswith(bye) for bye in self.BYE_WORDS)
+        return bool(text) and self._BYE_RE.search(text) is not None
 
     # --- State management ---
 
@@ -219,96 +406,57 @@ class VoiceAgentStateMachine:
         self.state = new_state
         self._epoch += 1
         self._cancel_all_timers()
-        print(f"[State] {old} -> {new_state}")
+        logger.debug("[State] %s -> %s", old, new_state)
 
         if self.board:
             self.board.on_button_press(None)
             self.board.on_button_release(None)
 
-        handler = {
-            "idle": self._enter_idle,
-            "active": self._enter_active,
-            "game": self._enter_game,
-            "music": self._enter_music,
-            "asleep": self._enter_asleep,
-        }.get(new_state)
+        handler = self._state_handlers.get(new_state)
 
         if handler:
             handler(**kwargs)
 
+        buttons = self._buttons.get(new_state)
+        if buttons and self.board and self.state == new_state:
+            self.board.on_button_press(buttons[0])
+            self.board.on_button_release(buttons[1])
+
     def _enter_idle(self, **kwargs):
-        name = Config.COMPANION_NAME
-        text = kwargs.get("text", f"Hold button to talk to {name}!")
         # Show family photo on idle screen (if configured), otherwise fall back
         idle_img = Config.IDLE_IMAGE_PATH
         if idle_img and os.path.exists(idle_img):
-            self._update_display(
-                status="sleeping",
-                emoji="🐷",
-                text=text,
-                turn="sleep",
-                scroll_speed=0,
-                image_path=idle_img,
+            self._apply_frame(
+                _AGENT_FRAMES["idle"], kwargs.get("text"), image_path=idle_img
             )
         else:
-            self._update_display(
-                status="sleeping",
-                emoji="🐷",
-                text=text,
-                turn="sleep",
-                scroll_speed=0,
-            )
-        if self.board:
-            self.board.on_button_press(self._on_button_press_idle)
-            self.board.on_button_release(self._on_button_release_idle)
+            self._apply_frame(_AGENT_FRAMES["idle"], kwargs.get("text"))
         # Auto-sleep after 2 min idle
         self._idle_timer = self._start_timer(
             self.IDLE_SLEEP_SEC, self._on_idle_sleep
         )
 
     def _enter_active(self, **kwargs):
-        name = Config.COMPANION_NAME
         # Clear idle image — active states use Piglet sprite
         display_state.update(image_path="")
         # Don't overwrite "listening" display if user is still holding button
         if not self._holding:
-            self._update_display(
-                status="ready",
-                emoji="🐷",
-                text=kwargs.get("text", f"{name} is here!"),
-                turn="red",
-                scroll_speed=0,
-            )
+            self._apply_frame(_AGENT_FRAMES["active"], kwargs.get("text"))
         self._touch_activity()
-        if self.board:
-            self.board.on_button_press(self._on_button_press_active)
-            self.board.on_button_release(self._on_button_release_active)
 
     def _enter_game(self, **kwargs):
         game = kwargs.get("game")
         if game:
             self._active_game = game
-            self._update_display(
-                status="playing",
-                emoji="🎮",
-                rgb=(255, 0, 255),
-            )
+            self._apply_frame(_AGENT_FRAMES["game"])
             if self.board:
                 self.board.on_button_press(game.on_button_press)
                 self.board.on_button_release(game.on_button_release)
             game.start(self)
 
     def _enter_music(self, **kwargs):
-        self._update_display(
-            status="playing music",
-            emoji="🎵",
-            rgb=(255, 105, 180),
-            scroll_speed=0,
-        )
+        self._apply_frame(_AGENT_FRAMES["music"])
         self._touch_activity()
-        if self.board:
-            self.board.on_button_press(self._on_button_press_active)
-            self.board.on_button_release(self._on_button_release_active)
 
     def exit_game(self):
         with self._lock:
@@ -335,18 +483,16 @@ class VoiceAgentStateMachine:
         if self.board:
             self.board.set_rgb(0, 0, 0)
             self.board.screen_off()
-        print("[State] Deep sleep — double-click to wake")
-        # Register wake-up button handler (double-click only)
+        logger.info("[State] Deep sleep — double-click to wake")
+        # Wake-up handler (double-click only) is bound from self._buttons
         self._last_click_time = 0
-        if self.board:
-            self.board.on_button_press(self._on_button_press_asleep)
 
     def _on_button_press_asleep(self):
         """Double-click in deep sleep wakes the device."""
         with self._lock:
             now = time.time()
             if now - self._last_click_time < self.DOUBLE_CLICK_SEC:
-                print("[Button] Double-click (asleep) -> waking up")
+                logger.info("[Button] Double-click (asleep) -> waking up")
                 self._last_click_time = 0
                 self._wake_up()
             else:
@@ -370,36 +516,42 @@ class VoiceAgentStateMachine:
     def _on_idle_sleep(self):
         """Idle screen too long — go to deep sleep to save power."""
         if self.state == "idle":
-            print(f"[State] Idle for {self.IDLE_SLEEP_SEC}s -> deep sleep")
+            logger.info("[State] Idle for %ss -> deep sleep", self.IDLE_SLEEP_SEC)
             self._set_state("asleep")
 
     # --- Notification flash (backlight + LED) ---
 
-    _flash_lock = threading.Lock()
-
     def _notify_flash(self, times=2, on_ms=80, off_ms=60):
         """Quick backlight + LED pulse to signal 'new content'."""
         if not self.board:
             return
-        if not self._flash_lock.acquire(blocking=False):
-            return
+        self._loop.call_soon_threadsafe(
+            self._start_flash, times, on_ms / 1000, off_ms / 1000
+        )
 
-        def _do_flash():
-            try:
-                saved_rgb = self._current_rgb or (0, 0, 0)
-                for _ in range(times):
-                    self.board.set_rgb(255, 255, 255)
-                    self.board.set_backlight(0)
-                    time.sleep(off_ms / 1000)
-                    self.board.set_rgb(*saved_rgb)
-                    self.board.set_backlight(100)
-                    time.sleep(on_ms / 1000)
-            except Exception as e:
-                print(f"[Flash] Error: {e}")
-            finally:
-                self._flash_lock.release()
+    def _start_flash(self, times, on_s, off_s):
+        """On the loop: lay out the flash as a chain of call_later steps."""
+        if self._flashing:
+            return
+        self._flashing = True
+        saved_rgb = self._current_rgb or (0, 0, 0)
+        at = 0.0
+        for _ in range(times):
+            self._loop.call_later(at, self._flash_step, (255, 255, 255), 0)
+            at += off_s
+            self._loop.call_later(at, self._flash_step, saved_rgb, 100)
+            at += on_s
+        self._loop.call_later(at, self._end_flash)
+
+    def _flash_step(self, rgb, backlight):
+        try:
+            self.board.set_rgb(*rgb)
+            self.board.set_backlight(backlight)
+        except Exception as e:
+            logger.error("[Flash] Error: %s", e)
 
-        threading.Thread(target=_do_flash, daemon=True).start()
+    def _end_flash(self):
+        self._flashing = False
 
     # --- Button handling: IDLE state ---
 
@@ -407,7 +559,7 @@ class VoiceAgentStateMachine:
         with self._lock:
             now = time.time()
             if now - self._last_click_time < self.DOUBLE_CLICK_SEC:
-                print("[Button] Double-click (idle) -> starting conversation")
+                logger.info("[Button] Double-click (idle) -> starting conversation")
                 self._last_click_time = 0
                 self._button_press_time = now
                 self._holding = True
@@ -421,12 +573,7 @@ class VoiceAgentStateMachine:
             if self._agent:
                 self._agent.set_input_enabled(False)
                 self._agent.suppress_output_for(self.RESPONSE_DELAY_SEC)
-                self._update_display(
-                    status="thinking",
-                    emoji="🤔",
-                    text="Let me think...",
-                    turn="amber",
-                )
+                self._apply_frame(_AGENT_THINKING)
 
     # --- Button handling: ACTIVE state ---
 
@@ -440,14 +587,10 @@ class VoiceAgentStateMachine:
 
             now = time.time()
             if now - self._last_click_time < self.DOUBLE_CLICK_SEC:
-                print("[Button] Double-click -> ending conversation")
+                logger.info("[Button] Double-click -> ending conversation")
                 self._last_click_time = 0
                 self._holding = False
-                threading.Thread(
-                    target=self._end_conversation,
-                    args=("double_click",),
-                    daemon=True,
-                ).start()
+                self._end_conversation("double_click")
                 return
 
             if not self._paused:
@@ -455,20 +598,13 @@ class VoiceAgentStateMachine:
                 if self._agent:
                     self._agent.silence_agent()
                     self._agent.set_input_enabled(True)
-                self._update_display(
-                    status="listening",
-                    emoji="🎤",
-                    text="I'm listening...",
-                    turn="green",
-                )
+                self._apply_frame(_AGENT_LISTENING)
             # If paused: don't start PTT — wait for release to see tap vs hold
 
             self._touch_activity()
 
     def _on_button_release_active(self):
         with self._lock:
-            self._cancel_timer("_kill_timer")
-
             hold_duration = time.time() - self._button_press_time
             self._holding = False
 
@@ -494,12 +630,7 @@ class VoiceAgentStateMachine:
                 if self._agent:
                     self._agent.set_input_enabled(False)
                     self._agent.suppress_output_for(self.RESPONSE_DELAY_SEC)
-                self._update_display(
-                    status="thinking",
-                    emoji="🤔",
-                    text="Let me think...",
-                    turn="amber",
-                )
+                self._apply_frame(_AGENT_THINKING)
             self._touch_activity()
 
     def _on_single_click(self):
@@ -508,19 +639,13 @@ class VoiceAgentStateMachine:
 
     def _toggle_pause(self):
         """Toggle pause state during an active conversation."""
-        name = Config.COMPANION_NAME
         if self._paused:
             # Unpause
             self._paused = False
             if self._agent:
                 self._agent.set_paused(False)
-            print("[State] Unpaused")
-            self._update_display(
-                status="ready",
-                emoji="🐷",
-                text=f"{name} is back!",
-                turn="red",
-            )
+            logger.info("[State] Unpaused")
+            self._apply_frame(_AGENT_UNPAUSED)
             self._touch_activity()
         else:
             # Pause
@@ -528,126 +653,148 @@ class VoiceAgentStateMachine:
             if self._agent:
                 self._agent.silence_agent()
                 self._agent.set_paused(True)
-            print("[State] Paused")
+            logger.info("[State] Paused")
             self._cancel_timer("_idle_timer")
-            self._update_display(
-                status="paused",
-                emoji="⏸️",
-                text="Paused — tap to resume",
-                turn="paused",
-            )
+            self._apply_frame(_AGENT_PAUSED)
 
     # --- Voice Agent event handler ---
 
     def _on_agent_event(self, event_type, data):
-        """Called from VoiceAgent receiver thread."""
-        with self._lock:
-            if not self.running or self.state not in ("active", "music", "game"):
-                return
-            self._handle_agent_event(event_type, data)
+        """Called from VoiceAgent receiver thread; handled on the loop.
 
-    def _handle_agent_event(self, event_type, data):
-        if event_type in ("ready", "connected"):
-            pass
+        deque.append is atomic, so the receiver never waits on self._lock
+        or runs display code; the loop drains events in arrival order.
+        """
+        if (event_type in self._DROPPABLE_EVENTS
+                and len(self._agent_events) >= self._AGENT_EVENT_BACKLOG):
+            return
+        self._agent_events.append((event_type, data))
+        self._loop.call_soon_threadsafe(self._drain_agent_events)
+
+    def _drain_agent_events(self):
+        events = self._agent_events
+        while events:
+            event_type, data = events.popleft()
+            with self._lock:
+                if not self.running or self.state not in _AGENT_EVENT_STATES:
+                    continue
+                self._handle_agent_event(event_type, data)
 
+    def _handle_agent_event(self, event_type, data):
         # While paused, only process errors, disconnects, and function calls
-        elif self._paused and event_type not in (
-            "error", "warning", "disconnected", "function_call"
-        ):
+        if self._paused and event_type not in self._PAUSED_EVENTS:
             return
+        handler = self._event_handlers.get(event_type)
+        if handler:
+            handler(data)
 
-        elif event_type == "user_speaking":
-            self._touch_activity()
+    def _on_user_speaking(self, data):
+        self._touch_activity()
+
+    def _on_agent_thinking(self, data):
+        self._touch_activity()
+        if not self._holding:
+            self._apply_frame(_AGENT_THINKING)
+
+    def _on_agent_speaking(self, data):
+        self._touch_activity()
+        if not self._holding:
+            self._apply_frame(_AGENT_TALKING)
 
-        elif event_type == "agent_thinking":
+    def _on_conversation_text(self, data):
+        role = data.get("role", "")
+        content = data.get("content", "")
+
+        if role == "user" and content:
             self._touch_activity()
-            if not self._holding:
-                self._update_display(
-                    status="thinking",
-                    emoji="🤔",
-                    text="Let me think...",
-                    turn="amber",
-                )
+            if self._check_for_bye(content):
+                logger.info("[State] Bye detected in: '%s'", content)
+                self._end_conversation("bye")
+                return
 
-        elif event_type == "agent_speaking":
+        if role == "assistant" and content:
             self._touch_activity()
-            if not self._holding:
-                self._update_display(
-                    status="talking",
-                    turn="red",
+            if not self._flashed_this_turn:
+                self._flashed_this_turn = True
+                self._notify_flash(times=2)
+            # Coalesce streamed transcript into <=10 display updates/sec
+            self._pending_transcript = content
+            if self._transcript_timer is None:
+                self._transcript_timer = self._start_timer(
+                    self.TRANSCRIPT_FLUSH_SEC, self._flush_transcript
                 )
 
-        elif event_type == "conversation_text":
-            role = data.get("role", "")
-            content = data.get("content", "")
-
-            if role == "user" and content:
-                self._touch_activity()
-                if self._check_for_bye(content):
-                    print(f"[State] Bye detected in: '{content}'")
-                    threading.Thread(
-                        target=self._end_conversation,
-                        args=("bye",),
-                        daemon=True,
-                    ).start()
-                    return
+    def _flush_transcript(self):
+        self._transcript_timer = None
+        if self._paused:
+            return
+        content = self._pending_transcript
+        self._update_display(
+            text=content,
+            emoji=self._latest_emoji(content) or "🐷",
+            scroll_speed=3,
+        )
 
-            if role == "assistant" and content:
-                self._touch_activity()
-                self._notify_flash(times=2)
-                emojis = _extract_emojis(content)
-                self._update_display(
-                    text=content,
-                    emoji=emojis or "🐷",
-                    scroll_speed=3,
-                )
+    def _on_agent_audio_done(self, data):
+        self._touch_activity()
+        self._assistant_text = ""
+        self._assistant_emoji = ""
+        self._flashed_this_turn = False
+        if self.state not in _MEDIA_STATES and not self._holding:
+            self._apply_frame(_AGENT_READY)
 
-        elif event_type == "agent_audio_done":
-            self._touch_activity()
-            if self.state not in ("game", "music") and not self._holding:
-                self._update_display(
-                    status="ready",
-                    turn="red",
-                )
+    def _on_function_call(self, data):
+        self._touch_activity()
+        name = data.get("name", "")
+        self._update_display(
+            text=f"Doing: {name}...",
+            alert_text=f"Working on: {name}",
+            alert_level="info",
+            alert_duration=2.0,
+        )
 
-        elif event_type == "function_call":
-            self._touch_activity()
-            name = data.get("name", "")
-            self._update_display(
-                text=f"Doing: {name}...",
-                alert_text=f"Working on: {name}",
-                alert_level="info",
-                alert_duration=2.0,
-            )
+    def _on_error(self, data):
+        desc = data.get("description", "Something went wrong")
+        self._update_display(
+            text=desc,
+            emoji="😟",
+            turn="red",
+            alert_text="Oops -- hit a snag",
+            alert_level="error",
+            alert_duration=3.2,
+        )
 
-        elif event_type == "error":
-            desc = data.get("description", "Something went wrong")
+    def _on_disconnected(self, data):
+        reason = data.get("reason", "")
+        if self.state == "active" and reason:
+            logger.warning("[State] Unexpected disconnect: %s, reconnecting...", reason)
             self._update_display(
-                text=desc,
-                emoji="😟",
-                turn="red",
-                alert_text="Oops -- hit a snag",
-                alert_level="error",
-                alert_duration=3.2,
+                alert_text="Connection dropped -- retrying",
+                alert_level="warn",
+                alert_duration=3.0,
             )
+            self._start_timer(self.RECONNECT_DELAY_SEC, self._reconnect)
 
-        elif event_type == "disconnected":
-            reason = data.get("reason", "")
-            if self.state == "active" and reason:
-                print(f"[State] Unexpected disconnect: {reason}, reconnecting...")
-                self._update_display(
-                    alert_text="Connection dropped -- retrying",
-                    alert_level="warn",
-                    alert_duration=3.0,
-                )
+    def _reconnect(self):
+        """Scheduled after an unexpected disconnect; epoch-guarded."""
+        if self.state == "active":
+            self.start_agent()
 
-                def _reconnect():
-                    time.sleep(2)
-                    with self._lock:
-                        if self.running and self.state == "active":
-                            self.start_agent()
+    def _latest_emoji(self, content):
+        """Last emoji in the assistant text, scanning only the new suffix.
 
-                threading.Thread(target=_reconnect, daemon=True).start()
+        When content extends the previous event's text, only the appended
+        part can change the answer; anything else starts a fresh scan.
+        """
+        prev = self._assistant_text
+        if prev and content.startswith(prev):
+            emoji = _extract_emojis(content, len(prev))
+            if emoji:
+                self._assistant_emoji = emoji
+        else:
+            self._assistant_emoji = _extract_emojis(content)
+        self._assistant_text = content
+        return self._assistant_emoji
 
     # --- Display helper ---
 
@@ -659,14 +806,49 @@ class VoiceAgentStateMachine:
 
         if "rgb" in kwargs and self.board:
             rgb = kwargs.pop("rgb")
-            now = time.time()
-            if rgb != self._current_rgb and (now - self._last_rgb_time) >= self._RGB_MIN_INTERVAL:
-                self._current_rgb = rgb
-                self._last_rgb_time = now
-                self.board.set_rgb(*rgb)
+            self._set_led(rgb)
             kwargs["rgb_color"] = rgb
         display_state.update(**kwargs)
 
+    def _apply_frame(self, frame, text=None, **extra):
+        """Show a precomputed state frame; text overrides the frame's own."""
+        if self.board:
+            self._set_led(frame.rgb)
+        display_state.update(
+            status=frame.status,
+            emoji=frame.emoji,
+            text=frame.text if text is None else text,
+            turn=frame.turn,
+            rgb_color=frame.rgb,
+            scroll_speed=frame.scroll_speed,
+            **extra,
+        )
+
+    def _set_led(self, rgb):
+        if self.render_thread and self.render_thread.running:
+            # RenderThread fades the LED to rgb_color on its next frame;
+            # writing GPIO here too would only block the agent thread
+            self._current_rgb = rgb
+            return
+        # Latest colour wins; the loop writes it at most every
+        # _RGB_MIN_INTERVAL so a burst never drops the final colour
+        self._pending_rgb = rgb
+        if not self._rgb_pump_armed:
+            self._rgb_pump_armed = True
+            self._loop.call_soon_threadsafe(self._pump_rgb)
+
+    def _pump_rgb(self):
+        wait = self._last_rgb_time + self._RGB_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            self._loop.call_later(wait, self._pump_rgb)
+            return
+        self._rgb_pump_armed = False
+        rgb = self._pending_rgb
+        if rgb != self._current_rgb:
+            self._current_rgb = rgb
+            self._last_rgb_time = time.monotonic()
+            self.board.set_rgb(*rgb)
+
 
 # ---------- LEGACY MODE (old batch pipeline) ----------
 
@@ -684,9 +866,10 @@ class LegacyStateMachine:
 
     DOUBLE_CLICK_SEC = 0.4  # max gap between clicks to count as double-click
     PHOTO_CYCLE_SEC = 12    # seconds between photo changes in idle
+    _PARTIAL_DISPLAY_INTERVAL = 0.066  # ~15 Hz cap on streaming redraws
+    MIN_RECORDING_BYTES = 5000  # below this the press was too short to say anything
 
     def __init__(self, board, render_thread):
-        from services.audio import set_volume, set_capture_volume
 
         self.board = board
         self.render_thread = render_thread
@@ -695,23 +878,62 @@ class LegacyStateMachine:
         self.running = True
         self._recording_path = ""
         self._answer_id = 0
+        # Set when the current answer is superseded; replaced per answer
+        self._cancel = threading.Event()
         self._active_game = None
         self._last_press_time = 0
         self._holding = False
-        self._photo_timer = None
+        # One slideshow thread for the process, woken on each entry to idle
+        self._photo_wake = threading.Event()
+        self._photo_thread = None
         self._photos = self._scan_photos()
         self._photo_index = 0
+        # STT, LLM turns and preloads run here rather than on a new thread
+        # each time. Speech has its own pools: a speaker submits its
+        # synthesis producer, and that must never queue behind LLM turns
+        # (or behind the speaker's own pool)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sm")
+        self._speaker_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sm-speak")
+        self._synth_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sm-synth")
+        # Tool replies are spoken one at a time, off the pipeline workers
+        self._tool_tts = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sm-tool-tts")
+
+        self._handlers = {
+            "idle": self._enter_idle,
+            "listening": self._enter_listening,
+            "thinking": self._enter_thinking,
+            "speaking": self._enter_speaking,
+            "game": self._enter_game,
+            "music": self._enter_music,
+            "asleep": self._enter_asleep,
+        }
+        # State -> (press, release) bound after the enter handler runs;
+        # game binds its own callbacks
+        talk = (self._on_button_press, self._on_button_release)
+        self._buttons = {
+            "idle": talk,
+            "listening": talk,
+            "thinking": talk,
+            "speaking": talk,
+            "music": (lambda: self._set_state("listening"), None),
+            "asleep": (self._on_button_press_asleep, None),
+        }
 
         set_volume(100)
         set_capture_volume(100)
 
+        # Provider SDK imports and client setup take seconds on a Pi; do
+        # them now rather than on the first button press.
+        for service in (stt, llm, tts):
+            self._submit(service.preload)
+
         self._set_state("asleep")
 
     def _scan_photos(self):
         """Scan photos directory for images."""
         photos_dir = Config.PHOTOS_DIR
         if not os.path.isdir(photos_dir):
-            print(f"[Photos] Directory not found: {photos_dir}")
+            logger.warning("[Photos] Directory not found: %s", photos_dir)
             return []
         exts = (".jpg", ".jpeg", ".png", ".bmp")
         photos = sorted([
@@ -719,29 +941,37 @@ class LegacyStateMachine:
             for f in os.listdir(photos_dir)
             if f.lower().endswith(exts)
         ])
-        print(f"[Photos] Found {len(photos)} photos")
+        logger.info("[Photos] Found %s photos", len(photos))
         return photos
 
     def stop(self):
         self.running = False
-        from services.audio import stop_recording
+        self._photo_wake.set()  # let the slideshow thread exit
         stop_recording()
         if self._active_game:
             self._active_game.stop()
         if self.board:
             self.board.set_rgb(0, 0, 0)
             self.board.screen_off()
+        for pool in (self._executor, self._speaker_pool, self._synth_pool, self._tool_tts):
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, fn, *args, pool=None):
+        """Run fn on the pipeline workers (or pool), logging anything it raises."""
+        def _run():
+            try:
+                return fn(*args)
+            except Exception as e:
+                logger.error("[State] %s failed: %s", fn.__name__, e)
+        return (pool or self._executor).submit(_run)
 
     def _set_state(self, new_state, **kwargs):
         old = self.state
         self.state = new_state
-        print(f"[State] {old} -> {new_state}")
+        logger.debug("[State] %s -> %s", old, new_state)
 
-        # Stop photo slideshow when leaving idle
-        if self._photo_timer:
-            self._photo_timer.cancel()
-            self._photo_timer = None
-        # Clear any displayed photo when leaving idle
+        # Clear any displayed photo when leaving idle; the slideshow stops
+        # itself once it sees the new state
         if old == "idle" and new_state != "idle":
             display_state.update(image_path="")
 
@@ -749,19 +979,16 @@ class LegacyStateMachine:
             self.board.on_button_press(None)
             self.board.on_button_release(None)
 
-        handler = {
-            "idle": self._enter_idle,
-            "listening": self._enter_listening,
-            "thinking": self._enter_thinking,
-            "speaking": self._enter_speaking,
-            "game": self._enter_game,
-            "music": self._enter_music,
-            "asleep": self._enter_asleep,
-        }.get(new_state)
+        handler = self._handlers.get(new_state)
 
         if handler:
             handler(**kwargs)
 
+        buttons = self._buttons.get(new_state)
+        if buttons and self.board and self.state == new_state:
+            self.board.on_button_press(buttons[0])
+            self.board.on_button_release(buttons[1])
+
     # --- Double-click detection (works in all awake states) ---
 
     def _on_button_press(self):
@@ -777,10 +1004,9 @@ class LegacyStateMachine:
 
         if gap < self.DOUBLE_CLICK_SEC:
             # Double-click → sleep
-            print("[Button] Double-click -> asleep")
+            logger.info("[Button] Double-click -> asleep")
             self._last_press_time = 0
-            from services.audio import stop_playback, stop_recording
-            self._answer_id += 1
+            self._new_answer()
             stop_playback()
             stop_recording()
             self._set_state("asleep")
@@ -810,8 +1036,7 @@ class LegacyStateMachine:
         if self.board:
             self.board.set_rgb(0, 0, 0)
             self.board.screen_off()
-            self.board.on_button_press(self._on_button_press_asleep)
-        print("[State] Asleep — double-click to wake")
+        logger.info("[State] Asleep — double-click to wake")
 
     def _on_button_press_asleep(self):
         """Double-click while asleep wakes the device."""
@@ -820,7 +1045,7 @@ class LegacyStateMachine:
         self._last_press_time = now
 
         if gap < self.DOUBLE_CLICK_SEC:
-            print("[Button] Double-click -> waking up")
+            logger.info("[Button] Double-click -> waking up")
             self._last_press_time = 0
             self._wake_up()
 
@@ -841,73 +1066,64 @@ class LegacyStateMachine:
     # --- Idle ---
 
     def _enter_idle(self, **kwargs):
-        self._update_display(
-            status="idle",
-            emoji="🐷",
-            text=kwargs.get("text", "Hold button to talk!"),
-            turn="sleep",
-            scroll_speed=0,
-        )
+        self._apply_frame(_FRAMES["idle"], text=kwargs.get("text"))
 
         # Start photo slideshow if photos exist
         if self._photos:
-            self._show_next_photo()
-
-        if self.board:
-            self.board.on_button_press(self._on_button_press)
-            self.board.on_button_release(self._on_button_release)
+            if self._photo_thread is None:
+                self._photo_thread = threading.Thread(
+                    target=self._slideshow_loop, name="photos", daemon=True
+                )
+                self._photo_thread.start()
+            self._photo_wake.set()
+
+    def _slideshow_loop(self):
+        """Cycle photos while idle; sleep on the wake event otherwise."""
+        wake = self._photo_wake
+        while self.running:
+            wake.wait()
+            wake.clear()
+            while self.running and self.state == "idle":
+                self._show_next_photo()
+                # Re-entering idle mid-wait shows the next photo straight away
+                if wake.wait(self.PHOTO_CYCLE_SEC):
+                    wake.clear()
 
     def _show_next_photo(self):
-        """Show next photo and schedule the one after."""
-        if not self._photos or self.state != "idle":
-            return
         photo = self._photos[self._photo_index % len(self._photos)]
         self._photo_index = (self._photo_index + 1) % len(self._photos)
         display_state.update(image_path=photo)
-        # Schedule next photo
-        self._photo_timer = threading.Timer(self.PHOTO_CYCLE_SEC, self._show_next_photo)
-        self._photo_timer.daemon = True
-        self._photo_timer.start()
 
     # --- Listening ---
 
     def _enter_listening(self, **kwargs):
-        from services.audio import start_recording
-        self._answer_id += 1
+        self._new_answer()
+        if kwargs.get("interrupt"):
+            # After the cancel, so the speaker can't start another clip
+            stop_playback()
         self._recording_path = os.path.join(
-            tempfile.gettempdir(), f"mombot_rec_{int(time.time())}.wav"
+            _TMPDIR, f"mombot_rec_{_PID}_{self._answer_id}.wav"
         )
 
-        self._update_display(
-            status="listening",
-            emoji="🎤",
-            text="I'm listening...",
-            turn="green",
-            scroll_speed=0,
-        )
+        self._apply_frame(_FRAMES["listening"])
 
         start_recording(self._recording_path)
 
-        if self.board:
-            self.board.on_button_press(self._on_button_press)
-            self.board.on_button_release(self._on_button_release)
-
     def _on_release_from_listening(self):
-        from services.audio import stop_recording
-        print("[State] Release detected, stopping recording...")
-        stop_recording()
+        logger.debug("[State] Release detected, stopping recording...")
+        stop_recording()  # returns once arecord has finalized the file
         self._update_display(turn="amber")
-        time.sleep(0.2)
-
-        if os.path.exists(self._recording_path):
-            fsize = os.path.getsize(self._recording_path)
-            print(f"[State] Recording file size: {fsize} bytes")
-            if fsize < 5000:
-                print("[State] Recording too short, back to idle")
-                self._set_state("idle")
-                return
-        else:
-            print(f"[State] Recording file not found: {self._recording_path}")
+
+        # One stat: the file can't vanish between an exists and a getsize
+        try:
+            fsize = os.stat(self._recording_path).st_size
+        except FileNotFoundError:
+            logger.warning("[State] Recording file not found: %s", self._recording_path)
+            self._set_state("idle")
+            return
+        logger.debug("[State] Recording file size: %s bytes", fsize)
+        if fsize < self.MIN_RECORDING_BYTES:
+            logger.info("[State] Recording too short, back to idle")
             self._set_state("idle")
             return
         self._set_state("thinking")
@@ -915,31 +1131,19 @@ class LegacyStateMachine:
     # --- Thinking ---
 
     def _enter_thinking(self, **kwargs):
-        self._update_display(
-            status="thinking",
-            emoji="🤔",
-            text="Let me think...",
-            turn="amber",
-            scroll_speed=0,
-        )
-
-        if self.board:
-            self.board.on_button_press(self._on_button_press)
-            self.board.on_button_release(self._on_button_release)
+        self._apply_frame(_FRAMES["thinking"])
 
-        thread = threading.Thread(target=self._process_voice, daemon=True)
-        thread.start()
+        self._submit(self._process_voice)
 
     def _process_voice(self):
-        from services import stt
-        current_id = self._answer_id
+        cancel = self._cancel
 
         try:
-            print("[STT] Recognizing...")
+            logger.debug("[STT] Recognizing...")
             text = stt.recognize(self._recording_path)
-            print(f"[STT] Result: {text}")
+            logger.info("[STT] Result: %s", text)
         except Exception as e:
-            print(f"[STT] Error: {e}")
+            logger.error("[STT] Error: %s", e)
             self._set_state("idle", text="Sorry, I couldn't hear that. Try again!")
             return
 
@@ -947,140 +1151,219 @@ class LegacyStateMachine:
             self._set_state("idle")
             return
 
-        if current_id != self._answer_id:
+        if cancel.is_set():
             return
 
-        self.conversation.add_user_message(text)
+        messages = self.conversation.add_user_message(text)
         self._update_display(text=f"You said: {text}")
 
-        self._set_state("speaking", user_text=text, answer_id=current_id)
+        self._set_state("speaking", user_text=text, cancel=cancel,
+                        messages=messages)
 
     def _enter_speaking(self, **kwargs):
-        answer_id = kwargs.get("answer_id", self._answer_id)
+        cancel = kwargs.get("cancel", self._cancel)
 
-        self._update_display(
-            status="answering",
-            emoji="🐷",
-            turn="red",
-            scroll_speed=3,
-        )
+        self._apply_frame(_FRAMES["speaking"])
 
-        if self.board:
-            self.board.on_button_press(self._on_button_press)
-            self.board.on_button_release(self._on_button_release)
+        self._submit(self._generate_and_speak, cancel, kwargs.get("messages"))
 
-        thread = threading.Thread(
-            target=self._generate_and_speak,
-            args=(answer_id,),
-            daemon=True,
-        )
-        thread.start()
+    def _new_answer(self):
+        """Cancel the in-flight answer and start a new generation."""
+        self._cancel.set()
+        self._cancel = threading.Event()
+        self._answer_id += 1
 
     def _interrupt_and_listen(self):
-        self._answer_id += 1
-        from services.audio import stop_playback
-        stop_playback()
-        self._set_state("listening")
-
-    def _generate_and_speak(self, answer_id):
-        from services import llm, tts
-        messages = self.conversation.get_messages()
-        full_response = ""
-        sentence_buffer = ""
+        # _enter_listening starts the new answer and stops playback
+        self._set_state("listening", interrupt=True)
+
+    def _generate_and_speak(self, cancel, messages=None):
+        if messages is None:
+            messages = self.conversation.get_messages()
+        # Deltas are joined only when shown (<=15 Hz) and once at the end
+        chunks = []
+        pending = []  # text after the last sentence boundary
+        # on_partial runs on the LLM pump thread, on_tool_call on the tool thread
+        pending_lock = threading.Lock()
+        last_emoji = ""
         tool_handled = False
+        last_display = 0.0
 
-        def on_partial(text):
-            nonlocal full_response, sentence_buffer
-            if answer_id != self._answer_id:
-                return
-            full_response += text
-            sentence_buffer += text
-            emojis = _extract_emojis(full_response)
+        # Sentences are spoken as soon as they complete, while the LLM is
+        # still streaming the rest
+        sentence_q = queue.Queue()
+        speaker = self._submit(
+            self._speak_sentences, sentence_q, cancel, pool=self._speaker_pool
+        )
+
+        def queue_sentences(text):
+            """Queue any sentences text completes; True if it ended one."""
+            with pending_lock:
+                pending.append(text)
+                if not _SENTENCE_END_RE.search(text):
+                    return False
+                buffered = "".join(pending)
+                cut = max(buffered.rfind(c) for c in _SENTENCE_END_CHARS) + 1
+                for sentence in tts.split_sentences(buffered[:cut])[0]:
+                    sentence_q.put(sentence)
+                pending[:] = [buffered[cut:]]
+                return True
+
+        def show_partial():
             self._update_display(
-                text=full_response,
-                emoji=emojis or "🐷",
+                text="".join(chunks),
+                emoji=last_emoji or "🐷",
                 scroll_speed=3,
             )
 
+        def on_partial(text):
+            nonlocal last_emoji, last_display
+            if cancel.is_set():
+                return
+            chunks.append(text)
+            sentence_ended = queue_sentences(text)
+            # Only the new delta can change the latest emoji
+            emoji = _extract_emojis(text)
+            if emoji:
+                last_emoji = emoji
+            # Coalesce redraws to ~15 Hz, but show sentence ends immediately
+            now = time.monotonic()
+            if (now - last_display < self._PARTIAL_DISPLAY_INTERVAL
+                    and not sentence_ended):
+                return
+            last_display = now
+            show_partial()
+
         def on_tool_call(name, args):
             nonlocal tool_handled
             tool_handled = True
-            print(f"[LLM] Tool call: {name}({args})")
+            logger.info("[LLM] Tool call: %s(%s)", name, args)
+            # Speak the preamble, even without closing punctuation, and let
+            # it finish before the tool talks
+            with pending_lock:
+                preamble = "".join(pending).strip()
+                pending.clear()
+            if preamble:
+                sentence_q.put(preamble)
+            sentence_q.put(_END_OF_SPEECH)
+            speaker.result()
             self._update_display(text=f"Doing: {name}...")
-            self._handle_tool_call(name, args, answer_id)
+            self._handle_tool_call(name, args, cancel)
 
         def on_done(text):
-            pass
+            # Flush whatever the throttle held back
+            if chunks and not cancel.is_set():
+                show_partial()
 
         try:
-            llm.chat_stream(messages, on_partial, on_tool_call, on_done)
+            llm.chat_stream(messages, on_partial, on_tool_call, on_done, cancel)
         except Exception as e:
-            print(f"[LLM] Error: {e}")
+            logger.error("[LLM] Error: %s", e)
+            sentence_q.put(_END_OF_SPEECH)
             self._set_state("idle", text="Oops, something went wrong. Try again!")
             return
 
-        if answer_id != self._answer_id:
-            return
+        remaining = "".join(pending).strip()
+        if remaining and not tool_handled:
+            sentence_q.put(remaining)
+        sentence_q.put(_END_OF_SPEECH)
 
-        if tool_handled:
+        if cancel.is_set() or tool_handled:
             return
 
+        full_response = "".join(chunks)
         if full_response.strip():
             self.conversation.add_assistant_message(full_response)
 
-            sentences, remaining = tts.split_sentences(full_response)
-            if remaining:
-                sentences.append(remaining)
+        speaker.result()  # wait for the last sentence to finish playing
+        if not cancel.is_set():
+            self._set_state("idle", text=full_response or "...")
 
-            for sentence in sentences:
-                if answer_id != self._answer_id:
-                    return
+    def _speak_sentences(self, sentences, cancel):
+        """Speak sentences from a queue until _END_OF_SPEECH; False if interrupted.
+
+        The first sentence streams straight to the speaker. The rest are
+        synthesized on a worker, up to two ahead, while earlier ones play.
+        """
+        first = _get_unless_cancelled(sentences, cancel)
+        if first is _END_OF_SPEECH:
+            return not cancel.is_set()
+        clips = queue.Queue(maxsize=2)
+
+        def produce():
+            while True:
+                sentence = _get_unless_cancelled(sentences, cancel)
+                if sentence is _END_OF_SPEECH:
+                    break
                 try:
-                    tts.synthesize_and_play(sentence)
+                    clip = tts.synthesize(sentence)
                 except Exception as e:
-                    print(f"[TTS] Error: {e}")
+                    logger.error("[TTS] Error: %s", e)
+                    clip = None
+                if not _put_unless_cancelled(clips, clip, cancel):
+                    return
+            _put_unless_cancelled(clips, _END_OF_SPEECH, cancel)
 
-        if answer_id == self._answer_id:
-            self._set_state("idle", text=full_response or "...")
+        self._submit(produce, pool=self._synth_pool)
 
-    def _handle_tool_call(self, name, args, answer_id):
-        from features.tools import execute_tool
-        from services import tts
+        try:
+            tts.synthesize_and_play(first)
+        except Exception as e:
+            logger.error("[TTS] Error: %s", e)
+
+        while True:
+            clip = _get_unless_cancelled(clips, cancel)
+            if clip is _END_OF_SPEECH:
+                break
+            if cancel.is_set():
+                return False
+            try:
+                tts.play_clip(clip)
+            except Exception as e:
+                logger.error("[TTS] Error: %s", e)
+        return not cancel.is_set()
+
+    def _handle_tool_call(self, name, args, cancel):
         result = execute_tool(name, args, self)
 
-        if result and answer_id == self._answer_id:
-            if self.state not in ("game",):
+        if result and not cancel.is_set():
+            if self.state != "game":
                 self._update_display(text=result)
-                try:
-                    tts.synthesize_and_play(result)
-                except Exception:
-                    pass
-                if answer_id == self._answer_id and self.state != "game":
-                    self._set_state("idle", text=result)
+                # Spoken on the tool TTS worker so the LLM's tool worker is
+                # free for the next call; one worker keeps replies in order
+                speech = self._tool_tts.submit(self._speak_tool_result, result, cancel)
+                speech.add_done_callback(
+                    lambda f: self._after_tool_speech(f, result, cancel)
+                )
+
+    def _speak_tool_result(self, result, cancel):
+        sentences = queue.Queue()
+        done, remaining = tts.split_sentences(result)
+        for sentence in done + ([remaining] if remaining else []):
+            sentences.put(sentence)
+        sentences.put(_END_OF_SPEECH)
+        self._speak_sentences(sentences, cancel)
+
+    def _after_tool_speech(self, future, result, cancel):
+        if future.cancelled():
+            return
+        if future.exception():
+            logger.error("[TTS] Tool reply failed: %s", future.exception())
+        if not cancel.is_set() and self.state != "game":
+            self._set_state("idle", text=result)
 
     def _enter_game(self, **kwargs):
         game = kwargs.get("game")
         if game:
             self._active_game = game
-            self._update_display(
-                status="playing",
-                emoji="🎮",
-                rgb=(255, 0, 255),
-            )
+            self._apply_frame(_FRAMES["game"])
             if self.board:
                 self.board.on_button_press(game.on_button_press)
                 self.board.on_button_release(game.on_button_release)
             game.start(self)
 
     def _enter_music(self, **kwargs):
-        self._update_display(
-            status="playing music",
-            emoji="🎵",
-            rgb=(255, 105, 180),
-            scroll_speed=0,
-        )
-        if self.board:
-            self.board.on_button_press(lambda: self._set_state("listening"))
+        self._apply_frame(_FRAMES["music"])
 
     def exit_game(self):
         if self._active_game:
@@ -1089,37 +1372,87 @@ class LegacyStateMachine:
         display_state.game_surface = None
         self._set_state("idle", text="That was fun! Want to play again?")
 
+    def _apply_frame(self, frame, text=None):
+        """Show a precomputed state frame; text overrides the frame's own."""
+        self._set_led(frame.rgb)
+        display_state.update(
+            status=frame.status,
+            emoji=frame.emoji,
+            text=frame.text if text is None else text,
+            turn=frame.turn,
+            rgb_color=frame.rgb,
+            scroll_speed=frame.scroll_speed,
+        )
+
     def _update_display(self, **kwargs):
         turn = kwargs.get("turn")
         if turn and turn in TURN_RGB:
             kwargs["rgb"] = TURN_RGB[turn]
 
-        if "rgb" in kwargs and self.board:
-            r, g, b = kwargs.pop("rgb")
-            self.board.set_rgb(r, g, b)
-            kwargs["rgb_color"] = (r, g, b)
+        rgb = kwargs.pop("rgb", None)
+        if rgb is not None:
+            self._set_led(rgb)
+            kwargs["rgb_color"] = rgb
         display_state.update(**kwargs)
 
+    def _set_led(self, rgb):
+        """Write the LED directly only when no render thread will.
+
+        RenderThread fades the LED toward display_state.rgb_color each frame,
+        so a direct write here would be a second GPIO write it then overrides.
+        """
+        if self.board and not (self.render_thread and self.render_thread.running):
+            self.board.set_rgb(*rgb)
+
 
 # ---------- Factory ----------
 
 def create_state_machine(board, render_thread):
     """Create the appropriate state machine based on config."""
     if Config.VOICE_AGENT_MODE:
-        print("[State] Using Voice Agent mode (Deepgram)")
+        logger.info("[State] Using Voice Agent mode (Deepgram)")
         return VoiceAgentStateMachine(board, render_thread)
     else:
-        print("[State] Using Legacy mode (batch STT/LLM/TTS)")
+        logger.info("[State] Using Legacy mode (batch STT/LLM/TTS)")
         return LegacyStateMachine(board, render_thread)
 
 
 # ---------- Helpers ----------
 
-def _extract_emojis(text):
-    import unicodedata
-    emojis = ""
-    for ch in text:
-        if unicodedata.category(ch) in ("So", "Sk") or ord(ch) > 0x1F000:
-            emojis += ch
-    return emojis[-1] if emojis else ""
+_SENTENCE_END_CHARS = ".!?;\n"  # same boundaries as tts.split_sentences
+_SENTENCE_END_RE = re.compile(f"[{re.escape(_SENTENCE_END_CHARS)}]")
+
+# Characters that might be emoji: everything outside ASCII, plus ^ and `
+# (the only ASCII So/Sk). The regex skips plain text in C, and
+# EmojiUtils.is_emoji makes the category-based call on what's left.
+_EMOJI_CANDIDATE_RE = re.compile(r"[^\x00-\x5d\x5f\x61-\x7f]")
+
+
+def _put_unless_cancelled(q, item, cancel):
+    """Blocking put that gives up once cancel is set."""
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_unless_cancelled(q, cancel):
+    """Blocking get; returns _END_OF_SPEECH once cancel is set."""
+    while not cancel.is_set():
+        try:
+            return q.get(timeout=0.5)
+        except queue.Empty:
+            continue
+    return _END_OF_SPEECH
+
+
+def _extract_emojis(text, start=0):
+    """Return the last emoji in text[start:], or ''. Scans without slicing."""
+    for ch in reversed(_EMOJI_CANDIDATE_RE.findall(text, start)):
+        if EmojiUtils.is_emoji(ch):
+            return ch
+    return ""
 
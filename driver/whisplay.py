@@ -1,6 +1,10 @@
 import os
+import queue
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import spidev
 
 try:
@@ -48,6 +52,18 @@ class WhisplayBoard:
     _BL_FREQ = 1000
     _RGB_FREQ = 100
 
+    # Max LCD transfers waiting behind the one on the wire. Keeps the render
+    # thread at most one frame ahead instead of queueing stale frames.
+    _TX_QUEUE_DEPTH = 2
+
+    # Dirty-row runs closer than this are merged into one window, since each
+    # window costs three extra commands on the wire.
+    _DIRTY_ROW_GAP = 4
+
+    # A button level change must still read the same after this long before
+    # it is reported, so contact chatter can't fire press/release pairs
+    _BTN_DEBOUNCE_SEC = 0.01
+
     def __init__(self):
         if not _LGPIO_AVAILABLE:
             raise RuntimeError(
@@ -68,8 +84,12 @@ class WhisplayBoard:
         self._btn_running = False
         self._btn_thread = None
         self.spi = None
+        self._tx_q = queue.Queue(maxsize=self._TX_QUEUE_DEPTH)
+        self._tx_thread = None
         self.button_press_callback = None
         self.button_release_callback = None
+        # Button callbacks run here instead of on a fresh thread per press
+        self._cb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="btn-cb")
         print(f"[GPIO] Using gpiochip{chip}")
 
         # Store pin numbers for cleanup
@@ -128,6 +148,13 @@ class WhisplayBoard:
         self.set_backlight(0)
         self._reset_lcd()
         self._init_display()
+
+        # All LCD writes after init go through the SPI writer thread, so the
+        # render thread can build the next frame while this one is on the wire.
+        self._tx_thread = threading.Thread(
+            target=self._tx_worker, name="lcd-spi", daemon=True
+        )
+        self._tx_thread.start()
         self.fill_screen(0)
 
     def _detect_hardware_version(self):
@@ -160,16 +187,21 @@ class WhisplayBoard:
     def screen_off(self):
         """Fully kill the display — no glow, no leakage."""
         self.fill_screen(0x0000)
-        self._send_command(0x28)  # DISPOFF
-        self._send_command(0x10)  # SLPIN (low-power mode)
+        self._submit(self._send_command, 0x28)  # DISPOFF
+        self._submit(self._send_command, 0x10)  # SLPIN (low-power mode)
+        self.flush()
         self.set_backlight(0)
 
     def screen_on(self):
         """Wake the display from screen_off."""
+        self._submit(self._wake_sequence)
+        self.flush()
+        self.set_backlight(100)
+
+    def _wake_sequence(self):
         self._send_command(0x11)  # SLPOUT
         time.sleep(0.12)         # ST7789 needs 120ms after SLPOUT
         self._send_command(0x29)  # DISPON
-        self.set_backlight(100)
 
     def _reset_lcd(self):
         lgpio.gpio_write(self._handle, self._rst_pin, 1)
@@ -221,6 +253,38 @@ class WhisplayBoard:
             for i in range(0, len(data), max_chunk):
                 self.spi.writebytes(data[i : i + max_chunk])
 
+    # --- SPI writer thread ---
+
+    def _tx_worker(self):
+        """Drain queued LCD transfers in order. Only thread touching SPI after init."""
+        while True:
+            job = self._tx_q.get()
+            try:
+                if job is None:
+                    return
+                fn, args = job
+                fn(*args)
+            except Exception as e:
+                print(f"[LCD] SPI write error: {e}")
+            finally:
+                self._tx_q.task_done()
+
+    def _submit(self, fn, *args):
+        """Queue an LCD transfer; blocks only while the queue is full."""
+        if self._tx_thread is None:
+            fn(*args)
+            return
+        self._tx_q.put((fn, args))
+
+    def flush(self):
+        """Block until every queued LCD transfer has been written."""
+        if self._tx_thread is not None:
+            self._tx_q.join()
+
+    def _write_window(self, x0, y0, x1, y1, data):
+        self.set_window(x0, y0, x1, y1)
+        self._send_data(data)
+
     def set_window(self, x0, y0, x1, y1, use_horizontal=0):
         if use_horizontal in (0, 1):
             self._send_command(0x2A, x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF)
@@ -241,8 +305,8 @@ class WhisplayBoard:
     def draw_pixel(self, x, y, color):
         if x >= self.LCD_WIDTH or y >= self.LCD_HEIGHT:
             return
-        self.set_window(x, y, x, y)
-        self._send_data([(color >> 8) & 0xFF, color & 0xFF])
+        self.previous_frame = None
+        self._submit(self._write_window, x, y, x, y, [(color >> 8) & 0xFF, color & 0xFF])
 
     def draw_line(self, x0, y0, x1, y1, color):
         dx = abs(x1 - x0)
@@ -263,17 +327,59 @@ class WhisplayBoard:
                 y0 += sy
 
     def fill_screen(self, color):
-        self.set_window(0, 0, self.LCD_WIDTH - 1, self.LCD_HEIGHT - 1)
         high = (color >> 8) & 0xFF
         low = color & 0xFF
         buf = bytes([high, low]) * (self.LCD_WIDTH * self.LCD_HEIGHT)
-        self._send_data(buf)
+        self.previous_frame = None
+        self._submit(
+            self._write_window,
+            0, 0, self.LCD_WIDTH - 1, self.LCD_HEIGHT - 1, buf,
+        )
 
     def draw_image(self, x, y, width, height, pixel_data):
+        """Queue pixel_data for the LCD. The caller must not reuse the buffer.
+
+        Full-screen frames are diffed against the previous one and only the
+        changed rows are sent.
+        """
         if (x + width > self.LCD_WIDTH) or (y + height > self.LCD_HEIGHT):
             raise ValueError("Image size exceeds screen bounds")
-        self.set_window(x, y, x + width - 1, y + height - 1)
-        self._send_data(pixel_data)
+        if x == 0 and y == 0 and width == self.LCD_WIDTH and height == self.LCD_HEIGHT:
+            self._draw_frame(pixel_data)
+            return
+        self.previous_frame = None
+        self._submit(
+            self._write_window,
+            x, y, x + width - 1, y + height - 1, pixel_data,
+        )
+
+    def _draw_frame(self, pixel_data):
+        W, H = self.LCD_WIDTH, self.LCD_HEIGHT
+        if not isinstance(pixel_data, (bytes, bytearray)):
+            pixel_data = bytes(pixel_data)
+        frame = np.frombuffer(pixel_data, dtype=np.uint16).reshape(H, W)
+        prev = self.previous_frame
+        self.previous_frame = frame
+
+        if prev is None:
+            self._submit(self._write_window, 0, 0, W - 1, H - 1, pixel_data)
+            return
+
+        rows = np.flatnonzero((frame != prev).any(axis=1))
+        if rows.size == 0:
+            return
+
+        # Split the changed rows into runs, merging runs with small gaps
+        breaks = np.flatnonzero(np.diff(rows) > self._DIRTY_ROW_GAP)
+        starts = np.concatenate(([rows[0]], rows[breaks + 1]))
+        ends = np.concatenate((rows[breaks], [rows[-1]]))
+        row_bytes = W * 2
+        for y0, y1 in zip(starts.tolist(), ends.tolist()):
+            self._submit(
+                self._write_window,
+                0, y0, W - 1, y1,
+                pixel_data[y0 * row_bytes:(y1 + 1) * row_bytes],
+            )
 
     def set_rgb(self, r, g, b):
         lgpio.tx_pwm(self._handle, self._red_pin, self._RGB_FREQ, 100 - (r / 255.0) * 100)
@@ -286,35 +392,46 @@ class WhisplayBoard:
     def set_rgb_fade(self, r_target, g_target, b_target, duration_ms=100):
         steps = 20
         delay = duration_ms / steps / 1000.0
-        r_start, g_start, b_start = self._current_r, self._current_g, self._current_b
-        for i in range(steps + 1):
-            t = i / steps
-            self.set_rgb(
-                max(0, min(255, int(r_start + (r_target - r_start) * t))),
-                max(0, min(255, int(g_start + (g_target - g_start) * t))),
-                max(0, min(255, int(b_start + (b_target - b_start) * t))),
-            )
+        # Whole integer ramp up front: one (steps+1, 3) array, no per-step float math
+        ramp = np.linspace(
+            (self._current_r, self._current_g, self._current_b),
+            (r_target, g_target, b_target),
+            steps + 1,
+        ).clip(0, 255).astype(np.uint8).tolist()
+        for r, g, b in ramp:
+            self.set_rgb(r, g, b)
             time.sleep(delay)
 
     def _button_poll_loop(self):
         while self._btn_running:
             state = lgpio.gpio_read(self._handle, self._btn_pin)
             if state != self._btn_last_state:
+                time.sleep(self._BTN_DEBOUNCE_SEC)
+                if lgpio.gpio_read(self._handle, self._btn_pin) != state:
+                    continue  # bounced back; re-sample straight away
                 self._btn_last_state = state
                 if state == 1:
                     print("[Button] PRESSED")
                     cb = self.button_press_callback
                     if cb:
-                        threading.Thread(target=cb, daemon=True).start()
+                        self._cb_pool.submit(self._run_callback, cb)
                 else:
                     print("[Button] RELEASED")
                     cb = self.button_release_callback
                     if cb:
-                        threading.Thread(target=cb, daemon=True).start()
+                        self._cb_pool.submit(self._run_callback, cb)
                     else:
                         print("[Button] No release callback registered!")
             time.sleep(0.02)
 
+    @staticmethod
+    def _run_callback(cb):
+        # Executor futures swallow exceptions; surface them like a thread would
+        try:
+            cb()
+        except Exception as e:
+            print(f"[Button] Callback error: {e}")
+
     def button_pressed(self):
         return lgpio.gpio_read(self._handle, self._btn_pin) == 1
 
@@ -326,6 +443,14 @@ class WhisplayBoard:
 
     def cleanup(self):
         self._btn_running = False
+        self._cb_pool.shutdown(wait=False, cancel_futures=True)
+        if self._tx_thread is not None:
+            try:
+                self._tx_q.put(None, timeout=1)
+                self._tx_thread.join(timeout=1)
+            except Exception:
+                pass
+            self._tx_thread = None
         if self.spi:
             try:
                 self.spi.close()
@@ -3,6 +3,7 @@ import time
 import random
 import math
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from ui.renderer import display_state
 
@@ -10,6 +11,14 @@ from ui.renderer import display_state
 class BrickBreakerGame:
     SCREEN_W = 240
     SCREEN_H = 280
+    BG_COLOR = (10, 5, 25)
+
+    BRICK_COLORS = [
+        (255, 100, 150), (255, 150, 100), (255, 200, 80),
+        (100, 255, 150), (100, 200, 255),
+    ]
+    BRICK_W = 28
+    BRICK_H = 12
 
     def __init__(self):
         self.running = False
@@ -35,14 +44,61 @@ class BrickBreakerGame:
         self.game_over = False
 
         self._init_bricks()
+        self._init_sprites()
+
+    def _init_sprites(self):
+        """Rasterize bricks, paddle and ball once as uint8 arrays.
+
+        _render composes them into a persistent frame buffer with slice
+        assignment instead of going through PIL draw calls.
+        """
+        self._frame = np.empty((self.SCREEN_H, self.SCREEN_W, 3), dtype=np.uint8)
+
+        self._brick_sprites = {}
+        for color in self.BRICK_COLORS:
+            sprite = Image.new("RGB", (self.BRICK_W + 1, self.BRICK_H + 1), self.BG_COLOR)
+            ImageDraw.Draw(sprite).rounded_rectangle(
+                [(0, 0), (self.BRICK_W, self.BRICK_H)],
+                radius=2, fill=color,
+            )
+            self._brick_sprites[color] = np.asarray(sprite)
+
+        paddle = Image.new("RGB", (self.paddle_w + 1, self.paddle_h + 1), self.BG_COLOR)
+        ImageDraw.Draw(paddle).rounded_rectangle(
+            [(0, 0), (self.paddle_w, self.paddle_h)],
+            radius=3, fill=(255, 200, 220),
+        )
+        self._paddle_sprite = np.asarray(paddle)
+
+        # Ball can overlap bricks, so only its inside pixels are written
+        d = self.ball_r * 2
+        ball = Image.new("RGBA", (d + 1, d + 1), (0, 0, 0, 0))
+        ImageDraw.Draw(ball).ellipse(
+            [(0, 0), (d, d)], fill=(255, 255, 255, 255),
+        )
+        ball = np.asarray(ball)
+        self._ball_sprite = np.ascontiguousarray(ball[:, :, :3])
+        self._ball_mask = ball[:, :, 3] > 0
+
+    def _blit(self, sprite, x, y, mask=None):
+        """Copy sprite into the frame buffer at (x, y), clipped to the screen."""
+        h, w = sprite.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.SCREEN_W), min(y + h, self.SCREEN_H)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = sprite[y0 - y:y1 - y, x0 - x:x1 - x]
+        dst = self._frame[y0:y1, x0:x1]
+        if mask is None:
+            dst[:] = src
+        else:
+            m = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+            dst[m] = src[m]
 
     def _init_bricks(self):
-        colors = [
-            (255, 100, 150), (255, 150, 100), (255, 200, 80),
-            (100, 255, 150), (100, 200, 255),
-        ]
-        brick_w = 28
-        brick_h = 12
+        colors = self.BRICK_COLORS
+        brick_w = self.BRICK_W
+        brick_h = self.BRICK_H
         gap = 2
         cols = (self.SCREEN_W - 10) // (brick_w + gap)
         rows = 5
@@ -158,7 +214,26 @@ class BrickBreakerGame:
 
     def _render(self):
         W, H = self.SCREEN_W, self.SCREEN_H
-        img = Image.new("RGB", (W, H), (10, 5, 25))
+        frame = self._frame
+        frame[:] = self.BG_COLOR
+
+        sprites = self._brick_sprites
+        for brick in self.bricks:
+            if brick["alive"]:
+                sprite = sprites[brick["color"]]
+                x, y = brick["x"], brick["y"]
+                frame[y:y + sprite.shape[0], x:x + sprite.shape[1]] = sprite
+
+        paddle_top = H - 25
+        px = self.paddle_x - self.paddle_w // 2
+        self._blit(self._paddle_sprite, px, paddle_top)
+
+        bx, by = int(self.ball_x), int(self.ball_y)
+        self._blit(self._ball_sprite, bx - self.ball_r, by - self.ball_r, self._ball_mask)
+
+        # Snapshot the buffer: the render thread reads game_surface while
+        # the next frame is being composed into self._frame.
+        img = Image.frombuffer("RGB", (W, H), frame.tobytes(), "raw", "RGB", 0, 1)
         draw = ImageDraw.Draw(img)
 
         try:
@@ -170,27 +245,6 @@ class BrickBreakerGame:
         hearts = "♥" * self.lives
         draw.text((W - 50, 2), hearts, fill=(255, 100, 150), font=font)
 
-        for brick in self.bricks:
-            if brick["alive"]:
-                x, y, w, h = brick["x"], brick["y"], brick["w"], brick["h"]
-                draw.rounded_rectangle(
-                    [(x, y), (x + w, y + h)],
-                    radius=2, fill=brick["color"],
-                )
-
-        paddle_top = H - 25
-        px = self.paddle_x - self.paddle_w // 2
-        draw.rounded_rectangle(
-            [(px, paddle_top), (px + self.paddle_w, paddle_top + self.paddle_h)],
-            radius=3, fill=(255, 200, 220),
-        )
-
-        bx, by = int(self.ball_x), int(self.ball_y)
-        draw.ellipse(
-            [(bx - self.ball_r, by - self.ball_r), (bx + self.ball_r, by + self.ball_r)],
-            fill=(255, 255, 255),
-        )
-
         if self.game_over:
             overlay_y = H // 2 - 30
             draw.rectangle([(0, overlay_y), (W, overlay_y + 60)], fill=(0, 0, 0))
@@ -2,27 +2,47 @@ import os
 import random
 
 from config import Config
-from services.audio import play_audio_file, stop_playback, is_playing
+from services.audio import play_audio_file, stop_playback
+
+_EXTS = frozenset((".mp3", ".wav", ".ogg", ".flac"))
 
 
 class MusicPlayer:
     def __init__(self):
         self.songs = []
         self.current_index = -1
-        self.is_playing = False
         self._current_proc = None
         self._scan_music()
 
+    @property
+    def is_playing(self):
+        """True while our aplay process is alive; drops it once it has exited."""
+        proc = self._current_proc
+        if proc is None:
+            return False
+        if proc.poll() is None:
+            return True
+        self._current_proc = None
+        return False
+
     def _scan_music(self):
         music_dir = Config.MUSIC_DIR
-        if not os.path.isdir(music_dir):
+        # scandir entries carry name, path and file type from the one
+        # directory read; no per-file stat or path joins
+        try:
+            with os.scandir(music_dir) as it:
+                entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+        except OSError:
             print(f"[Music] Directory not found: {music_dir}")
             return
-        for f in sorted(os.listdir(music_dir)):
-            if f.lower().endswith((".mp3", ".wav", ".ogg", ".flac")):
+        for e in entries:
+            dot = e.name.rfind(".")
+            if dot > 0 and e.name[dot:].lower() in _EXTS:
+                name = e.name[:dot]
                 self.songs.append({
-                    "name": os.path.splitext(f)[0],
-                    "path": os.path.join(music_dir, f),
+                    "name": name,
+                    "name_lower": name.lower(),  # for play_song matching
+                    "path": e.path,
                 })
         print(f"[Music] Found {len(self.songs)} songs")
 
@@ -39,7 +59,7 @@ class MusicPlayer:
         if name:
             name_lower = name.lower()
             for i, s in enumerate(self.songs):
-                if name_lower in s["name"].lower():
+                if name_lower in s["name_lower"]:
                     self.current_index = i
                     break
             else:
@@ -50,11 +70,10 @@ class MusicPlayer:
         song = self.songs[self.current_index]
         try:
             # Stop any current playback first
-            if self._current_proc and self._current_proc.poll() is None:
+            if self.is_playing:
                 stop_playback()
             # play_audio_file handles MP3→WAV conversion and routes through aplay
             self._current_proc = play_audio_file(song["path"], blocking=False)
-            self.is_playing = True
             return f"Now playing: {song['name']}"
         except Exception as e:
             print(f"[Music] Error playing {song['path']}: {e}")
@@ -64,7 +83,7 @@ class MusicPlayer:
         # aplay doesn't support pause — stop instead
         if self.is_playing:
             stop_playback()
-            self.is_playing = False
+            self._current_proc = None
             return "Music paused."
         return "No music is playing."
 
@@ -82,7 +101,6 @@ class MusicPlayer:
 
     def stop(self):
         stop_playback()
-        self.is_playing = False
         self._current_proc = None
         return "Music stopped."
 
@@ -0,0 +1,116 @@
+"""Similarity cache for voice queries that mean the same thing.
+
+"what's the weather" and "weather outside" miss the exact-match cache in
+web_search but should share an answer. Queries are embedded with a small
+sentence model and compared by cosine similarity against recent entries.
+
+Optional: needs sentence-transformers and SEMANTIC_CACHE=true in .env.
+Without either, get() always misses and torch is never imported.
+"""
+
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import numpy as np
+
+from config import Config
+
+# Checked without importing: sentence-transformers pulls in torch, which
+# costs seconds and hundreds of MB on a Pi even when the cache is off
+_ST_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+# Embeddings are unit-length, stored as int8 scaled by 127
+_Q_SCALE = 127
+# A lookup that takes longer than this is skipped; the search goes ahead
+_LOOKUP_TIMEOUT_SEC = 0.15
+
+
+class SemanticCache:
+    def __init__(self, threshold=0.92, max_entries=64, ttl_sec=300):
+        self.enabled = Config.SEMANTIC_CACHE and _ST_AVAILABLE
+        self._threshold = threshold
+        self._max = max_entries
+        self._ttl = ttl_sec
+        self._lock = threading.Lock()
+        self._model = None
+        self._loading = False
+        self._vecs = None            # (max_entries, dim) int8
+        self._stamps = np.full(max_entries, -np.inf)
+        self._results = [None] * max_entries
+        self._next = 0
+        # Embedding runs here so callers can bound how long a lookup waits
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semcache")
+
+    def _ensure_model(self):
+        """Start loading the model in the background; True once ready."""
+        if self._model is not None:
+            return True
+        with self._lock:
+            if not self._loading:
+                self._loading = True
+                threading.Thread(target=self._load_model, daemon=True).start()
+        return False
+
+    def _load_model(self):
+        try:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(_MODEL_NAME, device="cpu")
+            dim = model.get_sentence_embedding_dimension()
+            with self._lock:
+                self._vecs = np.zeros((self._max, dim), dtype=np.int8)
+                self._model = model
+            print(f"[SemanticCache] Loaded {_MODEL_NAME}")
+        except Exception as e:
+            print(f"[SemanticCache] Model load failed, disabling: {e}")
+            self.enabled = False
+
+    def _embed(self, text):
+        vec = self._model.encode(text, normalize_embeddings=True)
+        return np.round(vec * _Q_SCALE).astype(np.int8)
+
+    def get(self, query):
+        """Return a cached result for a similar query, or None.
+
+        Misses while the model is still loading, or if embedding the query
+        takes longer than _LOOKUP_TIMEOUT_SEC.
+        """
+        if not self.enabled or not self._ensure_model():
+            return None
+        try:
+            q = self._pool.submit(self._embed, query).result(_LOOKUP_TIMEOUT_SEC)
+        except TimeoutError:
+            return None
+        return self._lookup(q.astype(np.int32))
+
+    def _lookup(self, q):
+        with self._lock:
+            live = (time.monotonic() - self._stamps) < self._ttl
+            if not live.any():
+                return None
+            sims = (self._vecs.astype(np.int32) @ q) / (_Q_SCALE * _Q_SCALE)
+            sims[~live] = -1.0
+            best = int(sims.argmax())
+            if sims[best] < self._threshold:
+                return None
+            return self._results[best]
+
+    def put(self, query, result):
+        """Store result for query in the background; never blocks the caller."""
+        if not self.enabled or not self._ensure_model():
+            return
+        self._pool.submit(self._store, query, result)
+
+    def _store(self, query, result):
+        vec = self._embed(query)
+        with self._lock:
+            i = self._next
+            self._vecs[i] = vec
+            self._stamps[i] = time.monotonic()
+            self._results[i] = result
+            self._next = (i + 1) % self._max
+
+
+semantic_cache = SemanticCache(threshold=Config.SEMANTIC_CACHE_THRESHOLD)
@@ -1,245 +1,224 @@
+
 from services.audio import set_volume
 from features.music_player import music_player
+from features.games.brick_breaker import BrickBreakerGame
+from features.games.tic_tac_toe import TicTacToeGame
+from features.web_search import search_web
+from ui.renderer import display_state
 
 _current_volume = 100
+# init_mixer() boots at Config.INITIAL_VOLUME_LEVEL, so _current_volume is
+# only trusted to match the hardware after our first write.
+_volume_synced = False
 
-# --- Legacy format (OpenAI function calling, used when VOICE_AGENT_MODE=false) ---
-TOOL_DEFINITIONS = [
+# Reply templates, bound once
+_VOL_SET_TMPL = "Volume set to {}%".format
+_VOL_UP_TMPL = "Volume increased to {}%".format
+_VOL_DOWN_TMPL = "Volume decreased to {}%".format
+
+# --- Tool schemas ---
+# One canonical table; TOOL_DEFINITIONS and VOICE_AGENT_FUNCTIONS are
+# projections of it. "voice_description" overrides the text sent to the
+# Voice Agent where the spoken phrasing differs from the legacy one.
+_TOOLS_SPEC = [
     {
         "name": "play_song",
         "description": "Play a song from the music library. If no name given, plays a random song.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "Song name or partial match. Leave empty for random.",
-                }
+        "params": {
+            "name": {
+                "type": "string",
+                "description": "Song name or partial match. Leave empty for random.",
+                "voice_description": "Song name or partial match. Say 'random' for a random song.",
             },
         },
     },
     {
         "name": "list_songs",
         "description": "List all available songs in the music library.",
-        "parameters": {"type": "object", "properties": {}},
     },
     {
         "name": "stop_music",
         "description": "Stop the currently playing music.",
-        "parameters": {"type": "object", "properties": {}},
     },
     {
         "name": "set_volume",
         "description": "Set the speaker volume level.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "percent": {
-                    "type": "number",
-                    "description": "Volume level 0-100",
-                }
-            },
-            "required": ["percent"],
+        "voice_description": "Set the speaker volume to a specific level.",
+        "params": {
+            "percent": {"type": "number", "description": "Volume level 0-100"},
         },
+        "required": ["percent"],
     },
     {
         "name": "increase_volume",
         "description": "Increase the volume by 10%.",
-        "parameters": {"type": "object", "properties": {}},
+        "voice_description": "Increase the volume by 10 percent.",
     },
     {
         "name": "decrease_volume",
         "description": "Decrease the volume by 10%.",
-        "parameters": {"type": "object", "properties": {}},
+        "voice_description": "Decrease the volume by 10 percent.",
     },
     {
         "name": "start_game",
         "description": "Start a game. Available games: tic_tac_toe, brick_breaker.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "game_name": {
-                    "type": "string",
-                    "description": "Name of the game: tic_tac_toe or brick_breaker",
-                }
+        "voice_description": "Start a game. Available: tic_tac_toe, brick_breaker.",
+        "params": {
+            "game_name": {
+                "type": "string",
+                "description": "Name of the game: tic_tac_toe or brick_breaker",
+                "voice_description": "tic_tac_toe or brick_breaker",
             },
-            "required": ["game_name"],
         },
+        "required": ["game_name"],
     },
     {
         "name": "make_game_move",
         "description": "Make a tic-tac-toe move. Positions 1-9 like a numpad (7=top-left, 9=top-right, 1=bottom-left, 3=bottom-right).",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "position": {
-                    "type": "number",
-                    "description": "Position 1-9 on the tic-tac-toe board (numpad layout)",
-                }
+        "voice_description": "Make a tic-tac-toe move. Positions 1-9 like numpad (7=top-left, 5=center, 3=bottom-right).",
+        "params": {
+            "position": {
+                "type": "number",
+                "description": "Position 1-9 on the tic-tac-toe board (numpad layout)",
+                "voice_description": "Position 1-9 numpad layout",
             },
-            "required": ["position"],
         },
+        "required": ["position"],
     },
     {
         "name": "web_search",
         "description": "Search the web for current information. Use when asked about news, weather, facts, or anything you don't know.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query",
-                }
-            },
-            "required": ["query"],
+        "voice_description": "Search the web for current information like news, weather, sports scores, facts, or anything you don't know the answer to.",
+        "params": {
+            "query": {"type": "string", "description": "The search query"},
         },
+        "required": ["query"],
     },
 ]
 
 
-# --- Voice Agent format (Deepgram function calling) ---
-VOICE_AGENT_FUNCTIONS = [
-    {
-        "name": "play_song",
-        "description": "Play a song from the music library. If no name given, plays a random song.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string", "description": "Song name or partial match. Say 'random' for a random song."}
-            },
-        },
-    },
-    {
-        "name": "list_songs",
-        "description": "List all available songs in the music library.",
-        "parameters": {"type": "object", "properties": {}},
-    },
-    {
-        "name": "stop_music",
-        "description": "Stop the currently playing music.",
-        "parameters": {"type": "object", "properties": {}},
-    },
-    {
-        "name": "set_volume",
-        "description": "Set the speaker volume to a specific level.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "percent": {"type": "number", "description": "Volume level 0-100"}
-            },
-            "required": ["percent"],
-        },
-    },
-    {
-        "name": "increase_volume",
-        "description": "Increase the volume by 10 percent.",
-        "parameters": {"type": "object", "properties": {}},
-    },
-    {
-        "name": "decrease_volume",
-        "description": "Decrease the volume by 10 percent.",
-        "parameters": {"type": "object", "properties": {}},
-    },
-    {
-        "name": "start_game",
-        "description": "Start a game. Available: tic_tac_toe, brick_breaker.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "game_name": {"type": "string", "description": "tic_tac_toe or brick_breaker"}
-            },
-            "required": ["game_name"],
-        },
-    },
-    {
-        "name": "make_game_move",
-        "description": "Make a tic-tac-toe move. Positions 1-9 like numpad (7=top-left, 5=center, 3=bottom-right).",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "position": {"type": "number", "description": "Position 1-9 numpad layout"}
-            },
-            "required": ["position"],
-        },
-    },
-    {
-        "name": "web_search",
-        "description": "Search the web for current information like news, weather, sports scores, facts, or anything you don't know the answer to.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "query": {"type": "string", "description": "The search query"}
-            },
-            "required": ["query"],
+def _project(spec, voice):
+    """Build one function-calling schema from a _TOOLS_SPEC entry."""
+    def text(d):
+        return d.get("voice_description", d["description"]) if voice else d["description"]
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            name: {"type": p["type"], "description": text(p)}
+            for name, p in spec.get("params", {}).items()
         },
-    },
-]
+    }
+    if "required" in spec:
+        parameters["required"] = list(spec["required"])
+    return {"name": spec["name"], "description": text(spec), "parameters": parameters}
+
+
+# Both projections are built once and never mutated; tuples make that
+# explicit. Inner dicts stay plain so json / the SDKs can serialize them.
+
+# --- Legacy format (OpenAI function calling, used when VOICE_AGENT_MODE=false) ---
+TOOL_DEFINITIONS = tuple(_project(t, voice=False) for t in _TOOLS_SPEC)
+
+# --- Voice Agent format (Deepgram function calling) ---
+VOICE_AGENT_FUNCTIONS = tuple(_project(t, voice=True) for t in _TOOLS_SPEC)
+
+
+def _play_song(args, state_machine):
+    result = music_player.play_song(args.get("name"))
+    song = music_player.get_current_song_name()
+    if song:
+        display_state.update(status="playing music", emoji="🎵", text=f"Now playing: {song}")
+        if state_machine and hasattr(state_machine, '_set_state'):
+            state_machine._set_state("music")
+    return result
+
+
+def _list_songs(args, state_machine):
+    return music_player.list_songs()
+
+
+def _stop_music(args, state_machine):
+    return music_player.stop()
+
+
+def _apply_volume(pct):
+    global _current_volume, _volume_synced
+    _current_volume = pct
+    _volume_synced = True
+    set_volume(pct)
+
+
+def _set_volume(args, state_machine):
+    pct = int(args.get("percent", 70))
+    pct = max(0, min(100, pct))
+    if pct != _current_volume or not _volume_synced:
+        _apply_volume(pct)
+    return _VOL_SET_TMPL(pct)
+
+
+def _increase_volume(args, state_machine):
+    new = min(100, _current_volume + 10)
+    if new == _current_volume and _volume_synced:
+        return "Volume is already at max."
+    _apply_volume(new)
+    return _VOL_UP_TMPL(new)
+
+
+def _decrease_volume(args, state_machine):
+    new = max(0, _current_volume - 10)
+    if new == _current_volume and _volume_synced:
+        return "Volume is already at zero."
+    _apply_volume(new)
+    return _VOL_DOWN_TMPL(new)
+
+
+def _start_game(args, state_machine):
+    game_name = args.get("game_name", "").lower().replace(" ", "_")
+    if game_name == "tic_tac_toe":
+        game = TicTacToeGame()
+        if state_machine and hasattr(state_machine, '_set_state'):
+            state_machine._set_state("game", game=game)
+        return "Let's play tic-tac-toe! Say your move like 'top left' or 'center'. Long-press to quit."
+    elif game_name == "brick_breaker":
+        game = BrickBreakerGame()
+        if state_machine and hasattr(state_machine, '_set_state'):
+            state_machine._set_state("game", game=game)
+        return "Brick breaker time! Press the button to change paddle direction. Long-press to quit."
+    else:
+        return f"I don't know a game called '{game_name}'. I can play tic_tac_toe or brick_breaker!"
+
+
+def _make_game_move(args, state_machine):
+    if state_machine and hasattr(state_machine, '_active_game') and state_machine._active_game:
+        if hasattr(state_machine._active_game, "ai_move"):
+            pos = int(args.get("position", 5))
+            return state_machine._active_game.ai_move(pos)
+    return "No tic-tac-toe game is active right now."
+
+
+def _web_search(args, state_machine):
+    query = args.get("query", "")
+    return search_web(query)
+
+
+# Tool name -> handler(args, state_machine), built once at import
+_TOOL_HANDLERS = {
+    "play_song": _play_song,
+    "list_songs": _list_songs,
+    "stop_music": _stop_music,
+    "set_volume": _set_volume,
+    "increase_volume": _increase_volume,
+    "decrease_volume": _decrease_volume,
+    "start_game": _start_game,
+    "make_game_move": _make_game_move,
+    "web_search": _web_search,
+}
 
 
 def execute_tool(name, args, state_machine):
     """Execute a tool call from either the legacy LLM or the Voice Agent."""
-    global _current_volume
-
-    if name == "play_song":
-        result = music_player.play_song(args.get("name"))
-        song = music_player.get_current_song_name()
-        if song:
-            from ui.renderer import display_state
-            display_state.update(status="playing music", emoji="🎵", text=f"Now playing: {song}")
-            if state_machine and hasattr(state_machine, '_set_state'):
-                state_machine._set_state("music")
-        return result
-
-    elif name == "list_songs":
-        return music_player.list_songs()
-
-    elif name == "stop_music":
-        return music_player.stop()
-
-    elif name == "set_volume":
-        pct = int(args.get("percent", 70))
-        pct = max(0, min(100, pct))
-        _current_volume = pct
-        set_volume(pct)
-        return f"Volume set to {pct}%"
-
-    elif name == "increase_volume":
-        _current_volume = min(100, _current_volume + 10)
-        set_volume(_current_volume)
-        return f"Volume increased to {_current_volume}%"
-
-    elif name == "decrease_volume":
-        _current_volume = max(0, _current_volume - 10)
-        set_volume(_current_volume)
-        return f"Volume decreased to {_current_volume}%"
-
-    elif name == "start_game":
-        game_name = args.get("game_name", "").lower().replace(" ", "_")
-        if game_name == "tic_tac_toe":
-            from features.games.tic_tac_toe import TicTacToeGame
-            game = TicTacToeGame()
-            if state_machine and hasattr(state_machine, '_set_state'):
-                state_machine._set_state("game", game=game)
-            return "Let's play tic-tac-toe! Say your move like 'top left' or 'center'. Long-press to quit."
-        elif game_name == "brick_breaker":
-            from features.games.brick_breaker import BrickBreakerGame
-            game = BrickBreakerGame()
-            if state_machine and hasattr(state_machine, '_set_state'):
-                state_machine._set_state("game", game=game)
-            return "Brick breaker time! Press the button to change paddle direction. Long-press to quit."
-        else:
-            return f"I don't know a game called '{game_name}'. I can play tic_tac_toe or brick_breaker!"
-
-    elif name == "make_game_move":
-        if state_machine and hasattr(state_machine, '_active_game') and state_machine._active_game:
-            if hasattr(state_machine._active_game, "ai_move"):
-                pos = int(args.get("position", 5))
-                return state_machine._active_game.ai_move(pos)
-        return "No tic-tac-toe game is active right now."
-
-    elif name == "web_search":
-        from features.web_search import search_web
-        query = args.get("query", "")
-        return search_web(query)
-
-    return f"Unknown tool: {name}"
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}"
+    return handler(args, state_machine)
@@ -1,25 +1,91 @@
 """Web search via DuckDuckGo -- no API key needed."""
 
+import threading
+import time
+from collections import OrderedDict
+
 from duckduckgo_search import DDGS
 
+from features.semantic_cache import semantic_cache
+
+# Recent answers keyed on normalized query. Voice users repeat the same
+# questions ("what's the weather") a lot; a hit skips the network entirely.
+_CACHE_TTL_SEC = 300
+_CACHE_MAX = 128
+_cache = OrderedDict()  # key -> (timestamp, result)
+_cache_lock = threading.Lock()
+
+
+def _cache_key(query):
+    return " ".join(query.lower().split())
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        ts, result = entry
+        if time.monotonic() - ts >= _CACHE_TTL_SEC:
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key, result):
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), result)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+
+
+# One long-lived client keeps its HTTP session / TLS pool warm between
+# queries. Recreated after any error in case the session went bad.
+_client = None
+_client_lock = threading.Lock()
+
+
+def _ddgs_text(query, max_results):
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = DDGS()
+        try:
+            # v6+ returns a list already; no extra copy
+            return _client.text(query, max_results=max_results)
+        except Exception:
+            _client = None
+            raise
+
+
+_FOUND_PREFIX = "Here's what I found. "
+
 
 def search_web(query, max_results=3):
     """Search the web and return results formatted for voice output."""
-    try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
+    key = _cache_key(query)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    cached = semantic_cache.get(query)
+    if cached is not None:
+        _cache_put(key, cached)
+        return cached
 
-        if not results:
+    try:
+        hits = _ddgs_text(query, max_results)
+        found = " ... ".join(
+            f"{r.get('title', '')}: {r['body']}" for r in hits if r.get("body")
+        )
+        if not found:
             return f"I couldn't find anything about '{query}'."
 
-        parts = []
-        for r in results:
-            title = r.get("title", "")
-            body = r.get("body", "")
-            if body:
-                parts.append(f"{title}: {body}")
-
-        return "Here's what I found. " + " ... ".join(parts)
+        result = _FOUND_PREFIX + found
+        _cache_put(key, result)
+        semantic_cache.put(query, result)
+        return result
 
     except Exception as e:
         print(f"[WebSearch] Error: {e}")
@@ -1,10 +1,17 @@
 import atexit
+import ctypes
+import logging
+import logging.handlers
 import os
+import queue
+import re
+import shutil
 import signal
 import subprocess
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from config import Config
 from core.state_machine import create_state_machine
@@ -12,22 +19,207 @@ from services.battery import BatteryMonitor
 from ui.renderer import RenderThread, display_state
 
 
+_PYCACHE_TAG_PATH = os.path.expanduser("~/.mombot_pycache_tag")
+
+
+def _code_version(app_dir):
+    """Return the checked-out git commit, read straight from .git (no fork).
+
+    Returns None if it can't be determined, which forces a cache clear.
+    """
+    git_dir = os.path.join(app_dir, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head  # detached HEAD
+        ref = head[5:]
+        ref_path = os.path.join(git_dir, ref)
+        if os.path.exists(ref_path):
+            with open(ref_path) as f:
+                return f.read().strip()
+        with open(os.path.join(git_dir, "packed-refs")) as f:
+            for line in f:
+                if line.rstrip().endswith(" " + ref):
+                    return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+
+def _clear_pycache_if_code_changed():
+    """Clear __pycache__ only when the checked-out commit differs from last boot.
+
+    Walking the tree on every boot is slow on an SD card; after a git pull
+    HEAD moves, so that's the only time stale .pyc files can bite.
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    version = _code_version(app_dir)
+    if version:
+        try:
+            with open(_PYCACHE_TAG_PATH) as f:
+                if f.read().strip() == version:
+                    return
+        except OSError:
+            pass
+
+    _clear_pycache()
+
+    if version:
+        try:
+            with open(_PYCACHE_TAG_PATH, "w") as f:
+                f.write(version)
+        except OSError:
+            pass
+
+
+_PYCACHE_SKIP_DIRS = frozenset((".git", "venv", ".venv", "node_modules"))
+
+
+def _walk_pycache(path):
+    """Yield every __pycache__ dir under path, without descending into them."""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "__pycache__":
+                    yield entry.path
+                elif entry.name not in _PYCACHE_SKIP_DIRS:
+                    yield from _walk_pycache(entry.path)
+    except OSError:
+        pass
+
+
 def _clear_pycache():
     """Remove all __pycache__ dirs so stale bytecode never runs.
 
-    This is cheap (<10ms) and prevents the maddening issue where
-    git pull updates .py files but Python keeps running old .pyc.
+    Prevents the maddening issue where git pull updates .py files
+    but Python keeps running old .pyc.
     """
     app_dir = os.path.dirname(os.path.abspath(__file__))
-    for root, dirs, _files in os.walk(app_dir):
-        for d in dirs:
-            if d == "__pycache__":
-                cache_path = os.path.join(root, d)
+    for cache_path in _walk_pycache(app_dir):
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+# --- /proc helpers (no pgrep/pkill/fuser/ipcrm/kill forks) ---
+
+_GPIO_CHIPS = ("/dev/gpiochip4", "/dev/gpiochip0")
+_IPC_RMID = 0
+
+
+_PREV_INSTANCE_RE = re.compile(rb"python.*(?:main\.py|chatbot-ui\.py)")
+_AUDIO_PROC_RE = re.compile(rb"arecord|aplay")
+
+
+def _scan_procs(cmdline_re=None, held_paths=()):
+    """Single /proc pass standing in for `pgrep -f` and `fuser`.
+
+    Returns (pids whose cmdline matches cmdline_re, pids with an open fd on
+    any of held_paths, pids whose fds we weren't allowed to read). Our own
+    PID is excluded. Without root, other users' fds (root, the service
+    user) are unreadable, so a holder among them only shows up in the last
+    list.
+    """
+    my_pid = os.getpid()
+    matched, holders, unreadable = [], [], []
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        pid = int(name)
+        if pid == my_pid:
+            continue
+        if cmdline_re is not None:
+            try:
+                with open(f"/proc/{name}/cmdline", "rb") as f:
+                    cmdline = f.read().replace(b"\0", b" ")
+            except OSError:
+                continue
+            if cmdline_re.search(cmdline):
+                matched.append(pid)
+                continue
+        if held_paths:
+            fd_dir = f"/proc/{name}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except PermissionError:
+                unreadable.append(pid)
+                continue
+            except OSError:
+                continue
+            for fd in fds:
                 try:
-                    import shutil
-                    shutil.rmtree(cache_path)
-                except Exception:
-                    pass
+                    if os.readlink(f"{fd_dir}/{fd}") in held_paths:
+                        holders.append(pid)
+                        break
+                except OSError:
+                    continue
+    return matched, holders, unreadable
+
+
+def _fuser_holders(paths):
+    """PIDs holding any of paths per `sudo -n fuser`, or None if that failed.
+
+    Fallback for when /proc hid some processes' fds from us.
+    """
+    try:
+        result = subprocess.run(["sudo", "-n", "fuser", *paths],
+                                capture_output=True, text=True, timeout=3)
+    except Exception:
+        return None
+    # fuser exits 1 when nobody holds them; sudo also exits 1 when it
+    # can't run fuser (password needed, not installed), but says so
+    if result.returncode not in (0, 1) or result.stderr.startswith("sudo:"):
+        return None
+    my_pid = os.getpid()
+    # fuser prints PIDs (maybe with access letters) to stdout and the
+    # path labels to stderr
+    pids = (p.rstrip("cefFrm") for p in result.stdout.split())
+    return [int(p) for p in pids if p.isdigit() and int(p) != my_pid]
+
+
+def _gpio_holders(chips, holders, unreadable):
+    """Holders found in /proc, else fuser's answer if some fds were hidden."""
+    if holders or not unreadable:
+        return holders
+    found = _fuser_holders(chips)
+    if found is None:
+        print(f"[Cleanup] Couldn't read fds of {len(unreadable)} processes "
+              f"and sudo fuser failed; a GPIO holder owned by another user "
+              f"may be hidden")
+        return []
+    return found
+
+
+def _kill_pid(pid, sig=signal.SIGKILL):
+    try:
+        os.kill(pid, sig)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _remove_shm_segments(keys):
+    """Like `ipcrm -M key`: remove System V shm segments by key."""
+    try:
+        with open("/proc/sysvipc/shm") as f:
+            lines = f.readlines()[1:]
+    except OSError:
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 2:
+            continue
+        try:
+            key, shmid = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        if key in keys:
+            libc.shmctl(shmid, _IPC_RMID, None)
 
 
 def _force_kill_audio():
@@ -39,20 +231,17 @@ def _force_kill_audio():
     uninterruptible D-state — and that blocks the Python process too.
     Removing the stale IPC forces a fresh segment on next open.
     """
-    for proc_name in ("arecord", "aplay"):
-        try:
-            subprocess.run(["pkill", "-9", "-f", proc_name],
-                           capture_output=True, timeout=2)
-        except Exception:
-            pass
+    try:
+        for pid in _scan_procs(_AUDIO_PROC_RE)[0]:
+            _kill_pid(pid)
+    except Exception:
+        pass
 
     # Remove stale dsnoop/dmix shared-memory segments from asound.conf
-    for ipc_key in (555555, 666666):
-        try:
-            subprocess.run(["ipcrm", "-M", str(ipc_key)],
-                           capture_output=True, timeout=2)
-        except Exception:
-            pass
+    try:
+        _remove_shm_segments((555555, 666666))
+    except Exception:
+        pass
 
 
 def _gpio_chip_in_use():
@@ -60,20 +249,12 @@ def _gpio_chip_in_use():
 
     Returns (True, pid) if another process holds it, (False, None) otherwise.
     """
-    my_pid = os.getpid()
-    for chip in ("/dev/gpiochip4", "/dev/gpiochip0"):
-        if not os.path.exists(chip):
-            continue
+    chips = tuple(c for c in _GPIO_CHIPS if os.path.exists(c))
+    if chips:
         try:
-            result = subprocess.run(
-                ["sudo", "fuser", chip],
-                capture_output=True, text=True, timeout=3,
-            )
-            pids = (result.stderr + " " + result.stdout).strip().split()
-            for pid in pids:
-                pid = pid.strip()
-                if pid and pid.isdigit() and int(pid) != my_pid:
-                    return True, int(pid)
+            holders = _gpio_holders(chips, *_scan_procs(held_paths=chips)[1:])
+            if holders:
+                return True, holders[0]
         except Exception:
             pass
     return False, None
@@ -109,48 +290,29 @@ def _kill_previous_instance():
         except Exception:
             pass
 
-    my_pid = os.getpid()
-    killed_any = False
-    for pattern in ("python.*main\\.py", "python.*chatbot-ui\\.py"):
-        try:
-            result = subprocess.run(
-                ["pgrep", "-f", pattern],
-                capture_output=True, text=True, timeout=3,
-            )
-            for line in result.stdout.strip().split("\n"):
-                pid = line.strip()
-                if pid and int(pid) != my_pid:
-                    print(f"[Cleanup] Killing previous instance (PID {pid})")
-                    # SIGTERM first — lets the process run cleanup/gpio_free
-                    subprocess.run(["kill", "-15", pid],
-                                   capture_output=True, timeout=2)
-                    time.sleep(2)
-                    # SIGKILL as backup
-                    subprocess.run(["kill", "-9", pid],
-                                   capture_output=True, timeout=2)
-                    killed_any = True
-        except Exception:
-            pass
-
-    # Also kill anything holding /dev/gpiochip* directly
-    for chip in ("/dev/gpiochip4", "/dev/gpiochip0"):
-        if os.path.exists(chip):
-            try:
-                result = subprocess.run(
-                    ["sudo", "fuser", chip],
-                    capture_output=True, text=True, timeout=3,
-                )
-                # fuser outputs PIDs to stderr, not stdout
-                pids = (result.stderr + " " + result.stdout).strip().split()
-                for pid in pids:
-                    pid = pid.strip()
-                    if pid and int(pid) != my_pid:
-                        print(f"[Cleanup] Killing process holding {chip} (PID {pid})")
-                        subprocess.run(["kill", "-9", pid],
-                                       capture_output=True, timeout=2)
-                        killed_any = True
-            except Exception:
-                pass
+    # One /proc pass finds both old instances and direct GPIO holders
+    chips = tuple(c for c in _GPIO_CHIPS if os.path.exists(c))
+    try:
+        instances, holders, unreadable = _scan_procs(_PREV_INSTANCE_RE, chips)
+        holders = _gpio_holders(chips, holders, unreadable)
+    except Exception:
+        instances, holders = [], []
+    killed_any = bool(instances or holders)
+
+    if instances:
+        # SIGTERM first — lets the process run cleanup/gpio_free
+        for pid in instances:
+            print(f"[Cleanup] Killing previous instance (PID {pid})")
+            _kill_pid(pid, signal.SIGTERM)
+        time.sleep(2)
+        # SIGKILL as backup
+        for pid in instances:
+            _kill_pid(pid)
+
+    for pid in holders:
+        print(f"[Cleanup] Killing process holding GPIO (PID {pid})")
+        if not _kill_pid(pid):
+            print(f"[Cleanup] Couldn't kill PID {pid} (owned by another user?)")
 
     if killed_any:
         # Give kernel time to close fds and release GPIO claims
@@ -165,11 +327,8 @@ def _kill_previous_instance():
         print(f"[Cleanup] GPIO still held by PID {holder_pid}, "
               f"killing and waiting {wait_secs}s...")
         _force_kill_audio()
-        try:
-            subprocess.run(["kill", "-9", str(holder_pid)],
-                           capture_output=True, timeout=2)
-        except Exception:
-            pass
+        if not _kill_pid(holder_pid):
+            print(f"[Cleanup] Couldn't kill PID {holder_pid} (owned by another user?)")
         time.sleep(wait_secs)
 
 
@@ -189,51 +348,101 @@ def _sync_asoundrc():
             print(f"[ALSA] Failed to sync asoundrc: {e}")
 
 
+_LCD_INIT_ATTEMPTS = 10
+
+
+def _release_gpio_in_process():
+    """Drop any GPIO state this process still holds before an LCD retry.
+
+    A failed WhisplayBoard() closes its own handle, but a gpiozero pin
+    factory (if anything imported it) keeps lines claimed until closed.
+    Opening and closing the chip also makes lgpio drop a stale handle.
+    """
+    gpiozero = sys.modules.get("gpiozero")
+    if gpiozero is not None:
+        try:
+            factory = gpiozero.Device.pin_factory
+            if factory is not None:
+                factory.close()
+            gpiozero.Device.pin_factory = None
+        except Exception:
+            pass
+    try:
+        import lgpio
+        from driver.whisplay import _detect_gpio_chip
+        lgpio.gpiochip_close(lgpio.gpiochip_open(_detect_gpio_chip()))
+    except Exception:
+        pass
+
+
+def _init_audio():
+    # Sync ALSA config so audio changes propagate on git pull
+    _sync_asoundrc()
+
+    # Initialize WM8960 mixer (output routing switches, volumes).
+    # Must happen after asoundrc sync, before any audio playback.
+    from services.audio import init_mixer
+    init_mixer()
+
+
+def _setup_logging():
+    """Route logging through a queue so callers never block on stdout.
+
+    A listener thread does the actual write; the bare message format keeps
+    output identical to the print-based tags used elsewhere.
+    """
+    log_queue = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(getattr(logging, Config.LOG_LEVEL, logging.INFO))
+
+
 def main():
+    _setup_logging()
+
     if not Config.validate():
         print("Configuration errors found. Please check your .env file.")
         print("Copy env.template to .env and fill in your API keys.")
         sys.exit(1)
 
     # Clear stale bytecode so git pull always takes effect
-    _clear_pycache()
+    _clear_pycache_if_code_changed()
 
     # Kill any previous instance (frees GPIO); audio is killed first inside
     # this call to unblock any D-state audio syscalls in the old process.
     _kill_previous_instance()
 
-    # Sync ALSA config so audio changes propagate on git pull
-    _sync_asoundrc()
-
-    # Initialize WM8960 mixer (output routing switches, volumes).
-    # Must happen after asoundrc sync, before any audio playback.
-    from services.audio import init_mixer
-    init_mixer()
+    # Audio setup runs on a worker while the LCD initializes below; the two
+    # share no hardware. Joined before the state machine can play anything.
+    boot_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="boot")
+    audio_ready = boot_pool.submit(_init_audio)
 
     from driver.whisplay import WhisplayBoard
     board = None
-    for attempt in range(3):
+    for attempt in range(_LCD_INIT_ATTEMPTS):
         try:
             board = WhisplayBoard()
             print(f"[LCD] Initialized: {board.LCD_WIDTH}x{board.LCD_HEIGHT}")
             break
         except Exception as e:
             import traceback
-            print(f"[Driver] GPIO init failed (attempt {attempt+1}/3): {e}")
+            print(f"[Driver] GPIO init failed (attempt {attempt+1}/{_LCD_INIT_ATTEMPTS}): {e}")
             traceback.print_exc()
-            if attempt < 2:
+            if attempt < _LCD_INIT_ATTEMPTS - 1:
                 # Re-check for processes holding GPIO before retrying
                 _force_kill_audio()
-                time.sleep(0.5)
                 in_use, holder_pid = _gpio_chip_in_use()
                 if in_use:
                     print(f"[Driver] GPIO still held by PID {holder_pid}, killing...")
-                    try:
-                        subprocess.run(["kill", "-9", str(holder_pid)],
-                                       capture_output=True, timeout=2)
-                    except Exception:
-                        pass
-                backoff = 3 * (attempt + 1)   # 3s, then 6s
+                    _kill_pid(holder_pid)
+                _release_gpio_in_process()
+                backoff = min(1 + attempt, 5)   # 1s, 2s, ... capped at 5s
                 print(f"[Driver] Waiting {backoff}s before retry...")
                 time.sleep(backoff)
             else:
@@ -249,6 +458,12 @@ def main():
                 time.sleep(30)   # wait for reboot to take effect
                 sys.exit(1)
 
+    try:
+        audio_ready.result()
+    except Exception as e:
+        print(f"[Audio] Boot setup failed: {e}")
+    boot_pool.shutdown()
+
     font_path = Config.CUSTOM_FONT_PATH or "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 
     render_thread = None
@@ -308,9 +523,10 @@ def main():
     # Voice Agent mode: user holds button while speaking (push-to-talk).
     # Legacy mode: button press/release handled entirely by the state machine.
 
+    # Sleep until a signal arrives; the handlers above raise SystemExit.
     try:
         while True:
-            time.sleep(1)
+            signal.pause()
     except (KeyboardInterrupt, SystemExit):
         sys.exit(0)
 
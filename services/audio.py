@@ -123,6 +123,11 @@ def start_recording(output_path):
 
 
 def stop_recording():
+    """Stop arecord and return once it has exited.
+
+    arecord rewrites the WAV header and closes the file on SIGTERM, so the
+    recording is complete on disk when this returns.
+    """
     global _recording_process
     with _recording_lock:
         if _recording_process and _recording_process.poll() is None:
@@ -131,6 +136,7 @@ def stop_recording():
                 _recording_process.wait(timeout=2)
             except subprocess.TimeoutExpired:
                 _recording_process.kill()
+                _recording_process.wait()
             print("[Audio] Recording stopped")
         _recording_process = None
 
@@ -1,137 +1,359 @@
 import json
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from config import Config
+from features.tools import TOOL_DEFINITIONS
 
 
 def get_tool_definitions():
-    from features.tools import TOOL_DEFINITIONS
     return TOOL_DEFINITIONS
 
 
-def chat_stream(messages, on_partial=None, on_tool_call=None, on_done=None):
+# Provider-specific tool schemas never change at runtime; build them once.
+@lru_cache(maxsize=1)
+def _build_openai_tools():
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": t["name"],
+                "description": t["description"],
+                "parameters": t["parameters"],
+            }
+        }
+        for t in get_tool_definitions()
+    ]
+
+
+@lru_cache(maxsize=1)
+def _build_gemini_tools():
+    import google.generativeai as genai
+    return [
+        genai.protos.Tool(
+            function_declarations=[
+                genai.protos.FunctionDeclaration(
+                    name=t["name"],
+                    description=t["description"],
+                    parameters=genai.protos.Schema(
+                        type=genai.protos.Type.OBJECT,
+                        properties={
+                            k: genai.protos.Schema(
+                                type=genai.protos.Type.STRING,
+                                description=v.get("description", ""),
+                            )
+                            for k, v in t["parameters"].get("properties", {}).items()
+                        },
+                    ),
+                )
+            ]
+        )
+        for t in get_tool_definitions()
+    ]
+
+
+# Only these characters change JSON nesting state; everything else is skipped
+# by the regex engine rather than walked in Python.
+_JSON_STRUCT_RE = re.compile(r'[{}"\\]')
+
+
+class _ArgsBuffer:
+    """Collects one streamed tool call's JSON arguments.
+
+    Tracks brace depth (ignoring braces inside strings) as deltas arrive,
+    so the call can be dispatched as soon as the root object closes
+    instead of after the whole stream has finished. The arguments are
+    parsed once, at that moment.
+    """
+
+    def __init__(self):
+        self.name = ""
+        self.parts = []
+        self.dispatched = False
+        self._depth = 0
+        self._in_str = False
+        self._escape_at = -1     # index in the current delta after a backslash
+        self._parsed = None
+
+    def feed(self, text):
+        """Append a delta; True once the root JSON object is complete."""
+        self.parts.append(text)
+        if self._parsed is not None:
+            return True
+        # An escape started at the end of the previous delta
+        skip = 0 if self._escape_at == 0 else -1
+        self._escape_at = -1
+        for m in _JSON_STRUCT_RE.finditer(text):
+            i = m.start()
+            if i == skip:
+                continue
+            ch = m.group()
+            if self._in_str:
+                if ch == "\\":
+                    skip = i + 1
+                    if skip == len(text):
+                        self._escape_at = 0
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parsed = self._parse()
+                    return True
+        return False
+
+    def _parse(self):
+        raw = "".join(self.parts)
+        try:
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+
+    def args(self):
+        if self._parsed is not None:
+            return self._parsed
+        return self._parse()
+
+
+# Clients are built on first use and kept, so HTTP keep-alive survives
+# across turns instead of paying a fresh TLS handshake every request.
+@lru_cache(maxsize=1)
+def _openai_client():
+    from openai import OpenAI
+    return OpenAI(api_key=Config.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _gemini_model():
+    import google.generativeai as genai
+    genai.configure(api_key=Config.GEMINI_API_KEY)
+    gemini_tools = _build_gemini_tools()
+    return genai.GenerativeModel(
+        Config.GEMINI_MODEL,
+        tools=gemini_tools if gemini_tools else None,
+    )
+
+
+def preload():
+    """Import the SDK and build the client/tool schemas ahead of the first turn."""
+    if Config.LLM_PROVIDER == "openai":
+        _openai_client()
+        _build_openai_tools()
+    elif Config.LLM_PROVIDER == "gemini":
+        _gemini_model()
+
+
+# Tool calls run here, off the stream-reading thread, so a slow tool (web
+# search, starting playback) overlaps with the rest of the response. One
+# worker keeps multiple calls in the order the model issued them.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-tool")
+
+
+def _wait_tools(futures):
+    """Block until dispatched tool calls finish; re-raises their errors.
+
+    Callers rely on every on_tool_call having run once chat_stream returns.
+    """
+    for f in futures:
+        f.result()
+
+
+class _PartialPump:
+    """Runs on_partial on its own thread, fed through a bounded queue.
+
+    The stream loop only enqueues text, so a slow consumer (display
+    update, sentence queueing) never stalls reading the next token.
+    """
+
+    _SENTINEL = None
+
+    def __init__(self, on_partial, maxsize=64):
+        self._on_partial = on_partial
+        self._q = queue.Queue(maxsize=maxsize)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="llm-partial")
+        self._thread.start()
+
+    def put(self, text):
+        self._q.put(text)
+
+    def barrier(self):
+        """Return an Event set once everything queued before it is delivered."""
+        reached = threading.Event()
+        self._q.put(reached)
+        return reached
+
+    def _run(self):
+        while True:
+            text = self._q.get()
+            if text is self._SENTINEL:
+                return
+            if isinstance(text, threading.Event):
+                text.set()
+                continue
+            try:
+                self._on_partial(text)
+            except Exception as e:
+                print(f"[LLM] on_partial error: {e}")
+
+    def close(self):
+        """Drain remaining text and stop the consumer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._q.put(self._SENTINEL)
+        self._thread.join()
+
+
+def _tool_submitter(on_tool_call, pump=None):
+    """Wrap on_tool_call for dispatch onto _TOOL_POOL from the stream loop.
+
+    With a pump, each call first waits for the text streamed before it to
+    reach on_partial, so callers see a tool's preamble before the tool runs.
+    """
+    if on_tool_call is None:
+        return None
+
+    def submit(name, args):
+        if pump is None:
+            return _TOOL_POOL.submit(on_tool_call, name, args)
+        reached = pump.barrier()
+
+        def run():
+            reached.wait()
+            return on_tool_call(name, args)
+        return _TOOL_POOL.submit(run)
+    return submit
+
+
+def chat_stream(messages, on_partial=None, on_tool_call=None, on_done=None,
+                cancel=None):
+    """Stream a reply; stops reading early once the cancel Event is set."""
     provider = Config.LLM_PROVIDER
     if provider == "openai":
-        return _openai_chat_stream(messages, on_partial, on_tool_call, on_done)
+        stream = _openai_chat_stream
     elif provider == "gemini":
-        return _gemini_chat_stream(messages, on_partial, on_tool_call, on_done)
+        stream = _gemini_chat_stream
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
 
+    if on_partial is None:
+        return stream(messages, None, _tool_submitter(on_tool_call), on_done, cancel)
 
-def _openai_chat_stream(messages, on_partial, on_tool_call, on_done):
-    from openai import OpenAI
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    pump = _PartialPump(on_partial)
+    submit_tool = _tool_submitter(on_tool_call, pump)
 
-    tools_defs = get_tool_definitions()
-    openai_tools = []
-    for t in tools_defs:
-        openai_tools.append({
-            "type": "function",
-            "function": {
-                "name": t["name"],
-                "description": t["description"],
-                "parameters": t["parameters"],
-            }
-        })
+    # Every partial must be delivered before on_done / return
+    def done(text):
+        pump.close()
+        if on_done:
+            on_done(text)
+
+    try:
+        return stream(messages, pump.put, submit_tool, done, cancel)
+    finally:
+        pump.close()
+
+
+def _openai_chat_stream(messages, on_partial, submit_tool, on_done, cancel):
+    model = Config.OPENAI_LLM_MODEL
+    client = _openai_client()
+    openai_tools = _build_openai_tools()
 
     response = client.chat.completions.create(
-        model=Config.OPENAI_LLM_MODEL,
+        model=model,
         messages=messages,
         tools=openai_tools if openai_tools else None,
         stream=True,
     )
 
-    full_text = ""
+    text_parts = []
     tool_calls_data = {}
+    tool_futures = []
 
     for chunk in response:
+        if cancel is not None and cancel.is_set():
+            response.close()  # drop the HTTP stream; the answer was superseded
+            break
         delta = chunk.choices[0].delta if chunk.choices else None
         if not delta:
             continue
 
         if delta.content:
-            full_text += delta.content
+            text_parts.append(delta.content)
             if on_partial:
                 on_partial(delta.content)
 
         if delta.tool_calls:
             for tc in delta.tool_calls:
-                idx = tc.index
-                if idx not in tool_calls_data:
-                    tool_calls_data[idx] = {"name": "", "arguments": ""}
+                buf = tool_calls_data.get(tc.index)
+                if buf is None:
+                    buf = tool_calls_data[tc.index] = _ArgsBuffer()
                 if tc.function.name:
-                    tool_calls_data[idx]["name"] = tc.function.name
-                if tc.function.arguments:
-                    tool_calls_data[idx]["arguments"] += tc.function.arguments
+                    buf.name = tc.function.name
+                if tc.function.arguments and buf.feed(tc.function.arguments):
+                    # Arguments complete: dispatch now, not at stream end
+                    if submit_tool and buf.name and not buf.dispatched:
+                        buf.dispatched = True
+                        tool_futures.append(submit_tool(buf.name, buf.args()))
 
-    if tool_calls_data and on_tool_call:
+    if submit_tool and not (cancel is not None and cancel.is_set()):
         for idx in sorted(tool_calls_data.keys()):
-            tc = tool_calls_data[idx]
-            try:
-                args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-            except json.JSONDecodeError:
-                args = {}
-            on_tool_call(tc["name"], args)
+            buf = tool_calls_data[idx]
+            if not buf.dispatched:
+                buf.dispatched = True
+                tool_futures.append(submit_tool(buf.name, buf.args()))
 
+    full_text = "".join(text_parts)
     if on_done:
         on_done(full_text)
+    _wait_tools(tool_futures)
 
     return full_text
 
 
-def _gemini_chat_stream(messages, on_partial, on_tool_call, on_done):
-    import google.generativeai as genai
-    genai.configure(api_key=Config.GEMINI_API_KEY)
+# Gemini has no system role; system prompts go in as user turns
+_GEMINI_ROLE = {"user": "user", "system": "user", "assistant": "model", "model": "model"}
 
-    tools_defs = get_tool_definitions()
-    gemini_tools = []
-    for t in tools_defs:
-        gemini_tools.append(genai.protos.Tool(
-            function_declarations=[
-                genai.protos.FunctionDeclaration(
-                    name=t["name"],
-                    description=t["description"],
-                    parameters=genai.protos.Schema(
-                        type=genai.protos.Type.OBJECT,
-                        properties={
-                            k: genai.protos.Schema(
-                                type=genai.protos.Type.STRING,
-                                description=v.get("description", ""),
-                            )
-                            for k, v in t["parameters"].get("properties", {}).items()
-                        },
-                    ),
-                )
-            ]
-        ))
 
-    model = genai.GenerativeModel(
-        Config.GEMINI_MODEL,
-        tools=gemini_tools if gemini_tools else None,
-    )
+def _gemini_chat_stream(messages, on_partial, submit_tool, on_done, cancel):
+    model = _gemini_model()
 
-    gemini_messages = []
-    for m in messages:
-        role = "user" if m["role"] in ("user", "system") else "model"
-        gemini_messages.append({"role": role, "parts": [m["content"]]})
+    gemini_messages = [
+        {"role": _GEMINI_ROLE.get(m["role"], "model"), "parts": [m["content"]]}
+        for m in messages
+    ]
 
     response = model.generate_content(gemini_messages, stream=True)
 
-    full_text = ""
+    text_parts = []
+    tool_futures = []
     for chunk in response:
+        if cancel is not None and cancel.is_set():
+            break
         if chunk.text:
-            full_text += chunk.text
+            text_parts.append(chunk.text)
             if on_partial:
                 on_partial(chunk.text)
 
-        if hasattr(chunk, "candidates"):
-            for candidate in chunk.candidates:
-                for part in candidate.content.parts:
-                    if hasattr(part, "function_call") and part.function_call:
-                        fc = part.function_call
-                        if on_tool_call:
-                            on_tool_call(fc.name, dict(fc.args))
+        if not submit_tool:
+            continue
+        for candidate in getattr(chunk, "candidates", None) or ():
+            for part in candidate.content.parts:
+                fc = getattr(part, "function_call", None)
+                if fc:
+                    tool_futures.append(submit_tool(fc.name, dict(fc.args)))
 
+    full_text = "".join(text_parts)
     if on_done:
         on_done(full_text)
+    _wait_tools(tool_futures)
 
     return full_text
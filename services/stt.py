@@ -1,7 +1,31 @@
 import os
+from functools import lru_cache
+
 from config import Config
 
 
+# Built once; recognize() runs every turn on the state machine executor.
+@lru_cache(maxsize=1)
+def _openai_client():
+    from openai import OpenAI
+    return OpenAI(api_key=Config.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _gemini_model():
+    import google.generativeai as genai
+    genai.configure(api_key=Config.GEMINI_API_KEY)
+    return genai.GenerativeModel(Config.GEMINI_MODEL)
+
+
+def preload():
+    """Import the SDK and build the client ahead of the first turn."""
+    if Config.STT_PROVIDER == "openai":
+        _openai_client()
+    elif Config.STT_PROVIDER == "gemini":
+        _gemini_model()
+
+
 def recognize(audio_path):
     provider = Config.STT_PROVIDER
     if provider == "openai":
@@ -13,8 +37,7 @@ def recognize(audio_path):
 
 
 def _openai_stt(audio_path):
-    from openai import OpenAI
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    client = _openai_client()
     with open(audio_path, "rb") as f:
         result = client.audio.transcriptions.create(
             model="whisper-1",
@@ -25,9 +48,7 @@ def _openai_stt(audio_path):
 
 
 def _gemini_stt(audio_path):
-    import google.generativeai as genai
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-    model = genai.GenerativeModel(Config.GEMINI_MODEL)
+    model = _gemini_model()
     with open(audio_path, "rb") as f:
         audio_data = f.read()
     response = model.generate_content([
@@ -1,9 +1,34 @@
 import os
 import tempfile
+from functools import lru_cache
+
 from config import Config
 from services.audio import play_audio_file, play_pcm_stream
 
 
+# Clients are built once; constructing them per sentence is pure-Python
+# work that holds the GIL while the render thread wants it.
+@lru_cache(maxsize=1)
+def _openai_client():
+    from openai import OpenAI
+    return OpenAI(api_key=Config.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _gemini_model():
+    import google.generativeai as genai
+    genai.configure(api_key=Config.GEMINI_API_KEY)
+    return genai.GenerativeModel("gemini-2.0-flash")
+
+
+def preload():
+    """Import the SDK and build the client ahead of the first reply."""
+    if Config.TTS_PROVIDER == "openai":
+        _openai_client()
+    elif Config.TTS_PROVIDER == "gemini":
+        _gemini_model()
+
+
 def synthesize_and_play(text):
     provider = Config.TTS_PROVIDER
     if provider == "openai":
@@ -14,6 +39,32 @@ def synthesize_and_play(text):
         raise ValueError(f"Unknown TTS provider: {provider}")
 
 
+def synthesize(text):
+    """Synthesize text without playing it, for queueing ahead of playback.
+
+    Returns an opaque clip for play_clip(), or None if synthesis failed.
+    """
+    provider = Config.TTS_PROVIDER
+    if provider == "openai":
+        return ("pcm", _openai_tts_pcm(text))
+    elif provider == "gemini":
+        path = _gemini_tts_to_file(text)
+        return ("file", path) if path else None
+    else:
+        raise ValueError(f"Unknown TTS provider: {provider}")
+
+
+def play_clip(clip):
+    """Play a clip from synthesize(), blocking until it finishes."""
+    if clip is None:
+        return
+    kind, payload = clip
+    if kind == "pcm":
+        play_pcm_stream((payload,), sample_rate=24000, blocking=True)
+    else:
+        play_audio_file(payload, blocking=True)
+
+
 def synthesize_to_file(text, output_path=None):
     provider = Config.TTS_PROVIDER
     if provider == "openai":
@@ -26,8 +77,7 @@ def synthesize_to_file(text, output_path=None):
 
 def _openai_tts(text):
     """Stream TTS directly to speaker — playback starts as first bytes arrive."""
-    from openai import OpenAI
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    client = _openai_client()
 
     try:
         with client.audio.speech.with_streaming_response.create(
@@ -45,9 +95,19 @@ def _openai_tts(text):
             play_audio_file(path, blocking=True)
 
 
+def _openai_tts_pcm(text):
+    client = _openai_client()
+    response = client.audio.speech.create(
+        model="tts-1",
+        voice=Config.OPENAI_TTS_VOICE,
+        input=text,
+        response_format="pcm",
+    )
+    return response.content
+
+
 def _openai_tts_to_file(text, output_path=None):
-    from openai import OpenAI
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    client = _openai_client()
 
     if not output_path:
         fd, output_path = tempfile.mkstemp(suffix=".wav")
@@ -71,14 +131,12 @@ def _gemini_tts(text):
 
 def _gemini_tts_to_file(text, output_path=None):
     import google.generativeai as genai
-    genai.configure(api_key=Config.GEMINI_API_KEY)
 
     if not output_path:
         fd, output_path = tempfile.mkstemp(suffix=".wav")
         os.close(fd)
 
-    model = genai.GenerativeModel("gemini-2.0-flash")
-    response = model.generate_content(
+    response = _gemini_model().generate_content(
         f"Convert this text to speech: {text}",
         generation_config=genai.GenerationConfig(
             response_mime_type="audio/wav",
@@ -5,8 +5,12 @@ Binary frames = raw PCM audio. JSON text frames = control messages.
 """
 
 import json
+import socket
 import threading
 import time
+
+import websockets.sync.client
+
 from config import Config
 from core.companion import get_system_prompt
 from features.tools import VOICE_AGENT_FUNCTIONS, execute_tool
@@ -41,7 +45,7 @@ class VoiceAgent:
         self._state_machine = None  # set by state machine for tool calls
         self._audio_bytes_received = 0
         self._audio_bytes_written = 0
-        self._silence_seq = 0    # increments each silence_agent call; stale injects bail out
+        self._inject_cancel = None   # Event set when a newer press or disconnect supersedes a pending inject
         self._input_enabled = False  # True = button held, send real mic audio; False = send silence
         self._paused = False         # True = pause mode, mic sends silence AND agent audio discarded
         self._output_suppress_until = 0  # monotonic timestamp; buffer agent audio until this time
@@ -60,8 +64,6 @@ class VoiceAgent:
         if self._running:
             return
 
-        import websockets.sync.client
-
         self._running = True
         self._ready.clear()
         self._audio_bytes_received = 0
@@ -81,6 +83,12 @@ class VoiceAgent:
             self._running = False
             self._on_event("error", {"message": str(e)})
             return
+        # Small control frames shouldn't wait on Nagle's algorithm.
+        # Recent websockets releases already do this; older ones don't.
+        try:
+            self._ws.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as e:
+            print(f"[VoiceAgent] Couldn't set TCP_NODELAY: {e}")
 
         # Send settings
         settings = self._build_settings()
@@ -122,6 +130,7 @@ class VoiceAgent:
         if not self._running:
             return
         self._running = False
+        self._cancel_pending_inject()
         print("[VoiceAgent] Disconnecting...")
 
         # Kill mic
@@ -179,12 +188,11 @@ class VoiceAgent:
     def silence_agent(self, then_inject=None):
         """Immediately kill speaker output, then optionally inject a message.
 
-        Debounced: rapid presses only restart the speaker once and only
-        the last press's inject fires (earlier ones see a stale seq and bail).
+        Debounced: only the last press's inject fires; each press cancels
+        the one before it, and the waiter wakes immediately when cancelled.
         """
-        self._silence_seq += 1
-        my_seq = self._silence_seq
-        print(f"[VoiceAgent] Silencing agent (seq={my_seq})...")
+        self._cancel_pending_inject()
+        print("[VoiceAgent] Silencing agent...")
 
         with self._lock:
             # 1. Kill the speaker process — instant silence
@@ -206,14 +214,21 @@ class VoiceAgent:
 
         # 4. After a delay, inject — but only if no newer press happened
         if then_inject:
+            cancel = self._inject_cancel = threading.Event()
+
             def _delayed_inject():
-                time.sleep(2.0)
-                if self._silence_seq != my_seq:
-                    print(f"[VoiceAgent] Inject skipped (stale seq={my_seq}, current={self._silence_seq})")
+                if cancel.wait(2.0):
+                    print("[VoiceAgent] Inject skipped (superseded)")
                     return
                 self.inject_user_message(then_inject)
             threading.Thread(target=_delayed_inject, daemon=True).start()
 
+    def _cancel_pending_inject(self):
+        cancel = self._inject_cancel
+        if cancel:
+            cancel.set()
+            self._inject_cancel = None
+
     def update_prompt(self, new_prompt):
         """Update the system prompt mid-conversation."""
         if self._ws and self._running:
@@ -4,6 +4,7 @@ import math
 import random
 import time
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 
@@ -28,6 +29,13 @@ TURN_BASES = {
 }
 
 
+# Shared by every turn theme
+_TURN_TEXT_SOFT = (245, 245, 245, 255)
+_TURN_ALERT_INFO = (70, 150, 255, 255)
+_TURN_ALERT_WARN = (255, 190, 80, 255)
+_TURN_ALERT_ERROR = (255, 86, 102, 255)
+
+
 @dataclass(frozen=True)
 class UITheme:
     name: str
@@ -94,13 +102,26 @@ class ThemeRegistry:
             panel=_shade(base, 0.35),
             panel_alt=_shade(base, 0.12),
             border=_shade(base, 0.85),
-            text_soft=(245, 245, 245, 255),
-            alert_info=(70, 150, 255, 255),
-            alert_warn=(255, 190, 80, 255),
-            alert_error=(255, 86, 102, 255),
+            text_soft=_TURN_TEXT_SOFT,
+            alert_info=_TURN_ALERT_INFO,
+            alert_warn=_TURN_ALERT_WARN,
+            alert_error=_TURN_ALERT_ERROR,
         )
 
 
+# Build every turn theme up front so the first frame of a state change
+# doesn't pay for theme construction.
+for _turn in TURN_BASES:
+    ThemeRegistry.turn_theme(_turn)
+del _turn
+
+
+@lru_cache(maxsize=64)
+def text_bbox(font, text: str):
+    """Cached font.getbbox(); fonts hash by identity and live for the process."""
+    return font.getbbox(text)
+
+
 class Layout:
     """Shared layout contract for all screens/components."""
 
@@ -131,7 +152,7 @@ class Components:
         )
         if not hint:
             return
-        tb = font.getbbox(hint)
+        tb = text_bbox(font, hint)
         tw = tb[2] - tb[0]
         tx = max((width - tw) // 2, 6)
         ty = y0 + 5
@@ -170,24 +191,49 @@ class PigletCharacter:
 
     @classmethod
     def mood_for_status(cls, status: str) -> CharacterMood:
-        return cls.MOODS.get((status or "").lower(), cls.MOODS["ready"])
+        # Callers almost always pass a canonical lowercase status
+        mood = cls.MOODS.get(status)
+        return mood if mood is not None else _mood_for(status)
+
+
+@lru_cache(maxsize=32)
+def _mood_for(status: str) -> CharacterMood:
+    moods = PigletCharacter.MOODS
+    return moods.get((status or "").lower(), moods["ready"])
 
 
-def pulse(scale_min: float = 0.92, scale_max: float = 1.08, speed: float = 1.0) -> float:
-    t = time.time() * speed
-    s = (math.sin(t) + 1.0) * 0.5
+# One sine period, pre-mapped to 0..1, for pulse()
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = [(math.sin(2 * math.pi * i / _SIN_LUT_SIZE) + 1.0) * 0.5 for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_STEP = _SIN_LUT_SIZE / (2 * math.pi)
+
+
+def pulse(scale_min: float = 0.92, scale_max: float = 1.08, speed: float = 1.0,
+          now: float = None) -> float:
+    """Oscillate between scale_min and scale_max. Pass the frame's `now`
+    so every animated element shares one clock read."""
+    if now is None:
+        now = time.time()
+    s = _SIN_LUT[int(now * speed * _SIN_LUT_STEP) & (_SIN_LUT_SIZE - 1)]
     return scale_min + (scale_max - scale_min) * s
 
 
 def alert_color_for_level(theme: UITheme, level: str):
+    return getattr(theme, _alert_field(level))
+
+
+@lru_cache(maxsize=32)
+def _alert_field(level: str) -> str:
+    # Keyed on level only; transitions mint a new UITheme every frame
     level = (level or "info").lower()
     if level == "error":
-        return theme.alert_error
+        return "alert_error"
     if level in ("warn", "warning"):
-        return theme.alert_warn
-    return theme.alert_info
+        return "alert_warn"
+    return "alert_info"
 
 
+@lru_cache(maxsize=32)
 def hint_for_status(status: str) -> str:
     status = (status or "").lower()
     if status in ("sleeping", "idle", "sleep"):
@@ -205,6 +251,7 @@ def hint_for_status(status: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=32)
 def infer_turn(status: str) -> str:
     """Infer turn from status string (legacy compatibility)."""
     status = (status or "").lower()
@@ -221,10 +268,13 @@ def infer_turn(status: str) -> str:
 
 # --- Smooth transitions ---
 
-def _lerp_color(a: tuple, b: tuple, t: float) -> tuple:
-    """Linearly interpolate between two RGBA color tuples."""
-    t = max(0.0, min(1.0, t))
-    return tuple(_clamp(int(a[i] + (b[i] - a[i]) * t)) for i in range(min(len(a), len(b))))
+_THEME_COLOR_FIELDS = ("background", "panel", "panel_alt", "border",
+                       "text_soft", "alert_info", "alert_warn", "alert_error")
+
+
+def _theme_colors(theme: UITheme) -> np.ndarray:
+    """Theme colours as an (8, 4) array, in UITheme field order."""
+    return np.array([getattr(theme, f) for f in _THEME_COLOR_FIELDS], dtype=np.float32)
 
 
 def _ease_out_cubic(t: float) -> float:
@@ -232,6 +282,21 @@ def _ease_out_cubic(t: float) -> float:
     return 1.0 - (1.0 - t) ** 3
 
 
+# Eased progress is quantised to this many steps; each (from, to, step)
+# theme is built once and reused by every later transition between the
+# same two turns.
+_TRANSITION_BUCKETS = 16
+
+
+@lru_cache(maxsize=64)
+def _transition_theme(prev_turn: str, curr_turn: str, bucket: int) -> UITheme:
+    prev = _theme_colors(ThemeRegistry.turn_theme(prev_turn))
+    curr = _theme_colors(ThemeRegistry.turn_theme(curr_turn))
+    t = bucket / _TRANSITION_BUCKETS
+    out = (prev + (curr - prev) * t).astype(np.int16).clip(0, 255).tolist()
+    return UITheme(f"transition:{prev_turn}->{curr_turn}", *map(tuple, out))
+
+
 class TransitionManager:
     """Manages smooth color transitions between UI states.
 
@@ -270,17 +335,8 @@ class TransitionManager:
             return self._curr_theme
 
         t = _ease_out_cubic(elapsed / self.DURATION)
-        return UITheme(
-            name=f"transition:{self._prev_turn}->{self._curr_turn}",
-            background=_lerp_color(self._prev_theme.background, self._curr_theme.background, t),
-            panel=_lerp_color(self._prev_theme.panel, self._curr_theme.panel, t),
-            panel_alt=_lerp_color(self._prev_theme.panel_alt, self._curr_theme.panel_alt, t),
-            border=_lerp_color(self._prev_theme.border, self._curr_theme.border, t),
-            text_soft=_lerp_color(self._prev_theme.text_soft, self._curr_theme.text_soft, t),
-            alert_info=_lerp_color(self._prev_theme.alert_info, self._curr_theme.alert_info, t),
-            alert_warn=_lerp_color(self._prev_theme.alert_warn, self._curr_theme.alert_warn, t),
-            alert_error=_lerp_color(self._prev_theme.alert_error, self._curr_theme.alert_error, t),
-        )
+        return _transition_theme(self._prev_turn, self._curr_turn,
+                                 int(t * _TRANSITION_BUCKETS))
 
     @property
     def is_transitioning(self) -> bool:
@@ -289,47 +345,47 @@ class TransitionManager:
 
 # --- Particle system ---
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float       # remaining life in seconds
-    max_life: float
-    kind: str          # "heart", "sparkle", "note"
-    size: int = 4
-
-
 class ParticleSystem:
     """Lightweight particle effects for the LCD display.
 
     Spawns small hearts, sparkles, or music notes that float
     upward and fade out. Designed to be cheap on the Pi Zero.
     Max ~12 particles at a time to keep render cost negligible.
+
+    Particles live in fixed-size parallel arrays (one slot per particle)
+    so physics is a handful of vectorised ops; only drawing loops.
     """
 
     MAX_PARTICLES = 12
 
     def __init__(self):
-        self._particles: list[Particle] = []
+        n = self.MAX_PARTICLES
+        self._x = np.zeros(n, dtype=np.float32)
+        self._y = np.zeros(n, dtype=np.float32)
+        self._vx = np.zeros(n, dtype=np.float32)
+        self._vy = np.zeros(n, dtype=np.float32)
+        self._life = np.zeros(n, dtype=np.float32)
+        self._max_life = np.ones(n, dtype=np.float32)
+        self._size = np.zeros(n, dtype=np.int16)
+        self._alive = np.zeros(n, dtype=bool)
+        self._kind = np.zeros(n, dtype=np.int8)    # index into _PARTICLE_KINDS
         self._last_update = time.time()
         self._last_spawn = 0.0
 
     def emit(self, kind: str, x: int, y: int, count: int = 3):
         """Spawn particles at (x, y). kind: 'heart', 'sparkle', 'note'."""
-        for _ in range(min(count, self.MAX_PARTICLES - len(self._particles))):
+        free = np.flatnonzero(~self._alive)[:count]
+        for i in free:
             life = random.uniform(0.8, 1.6)
-            self._particles.append(Particle(
-                x=x + random.uniform(-8, 8),
-                y=y + random.uniform(-4, 4),
-                vx=random.uniform(-12, 12),
-                vy=random.uniform(-30, -15),
-                life=life,
-                max_life=life,
-                kind=kind,
-                size=random.randint(3, 5),
-            ))
+            self._x[i] = x + random.uniform(-8, 8)
+            self._y[i] = y + random.uniform(-4, 4)
+            self._vx[i] = random.uniform(-12, 12)
+            self._vy[i] = random.uniform(-30, -15)
+            self._life[i] = life
+            self._max_life[i] = life
+            self._size[i] = random.randint(3, 5)
+            self._kind[i] = _PARTICLE_KINDS.get(kind, -1)
+            self._alive[i] = True
 
     def update_and_draw(self, image: Image.Image, dt: float = None):
         """Advance physics and draw surviving particles onto image."""
@@ -339,42 +395,45 @@ class ParticleSystem:
         self._last_update = now
         dt = min(dt, 0.1)  # cap to avoid jumps
 
-        surviving = []
-        d = ImageDraw.Draw(image)
+        alive = self._alive
+        if not alive.any():
+            return
+        self._life[alive] -= dt
+        alive &= self._life > 0
+        self._x[alive] += self._vx[alive] * dt
+        self._y[alive] += self._vy[alive] * dt
+        self._vy[alive] += 8 * dt  # slight gravity (slows upward drift)
 
-        for p in self._particles:
-            p.life -= dt
-            if p.life <= 0:
+        if not alive.any():
+            return
+        d = ImageDraw.Draw(image)
+        # RGB targets can't show alpha anyway: skip it and use the base colour
+        with_alpha = image.mode == "RGBA"
+        alpha_all = np.maximum(255 * self._life / self._max_life, 60).astype(np.int32)
+        for kind, (draw_fn, base) in enumerate(_PARTICLE_DRAW):
+            idx = np.flatnonzero(alive & (self._kind == kind))
+            if not len(idx):
                 continue
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vy += 8 * dt  # slight gravity (slows upward drift)
-
-            alpha = int(255 * (p.life / p.max_life))
-            ix, iy = int(p.x), int(p.y)
-
-            if p.kind == "heart":
-                _draw_tiny_heart(d, ix, iy, p.size, alpha)
-            elif p.kind == "sparkle":
-                _draw_tiny_sparkle(d, ix, iy, p.size, alpha)
-            elif p.kind == "note":
-                _draw_tiny_note(d, ix, iy, p.size, alpha)
-
-            surviving.append(p)
-
-        self._particles = surviving
+            xs = self._x[idx].astype(np.int32).tolist()
+            ys = self._y[idx].astype(np.int32).tolist()
+            sizes = self._size[idx].tolist()
+            if with_alpha:
+                inks = [base + (a,) for a in alpha_all[idx].tolist()]
+            else:
+                inks = [base] * len(idx)
+            for ix, iy, size, ink in zip(xs, ys, sizes, inks):
+                draw_fn(d, ix, iy, size, ink)
 
     @property
     def active(self) -> bool:
-        return len(self._particles) > 0
+        return bool(self._alive.any())
 
     def clear(self):
-        self._particles.clear()
+        self._alive[:] = False
 
 
-def _draw_tiny_heart(d, x, y, size, alpha):
+def _draw_tiny_heart(d, x, y, size, c):
     """Draw a tiny heart shape."""
-    c = (255, 120, 150, max(60, alpha))
     hs = size // 2
     # Two small circles + triangle to approximate heart
     d.ellipse((x - hs, y - hs, x, y), fill=c)
@@ -382,15 +441,26 @@ def _draw_tiny_heart(d, x, y, size, alpha):
     d.polygon([(x - hs, y - 1), (x + hs, y - 1), (x, y + hs)], fill=c)
 
 
-def _draw_tiny_sparkle(d, x, y, size, alpha):
+def _draw_tiny_sparkle(d, x, y, size, c):
     """Draw a tiny 4-point sparkle."""
-    c = (255, 255, 200, max(60, alpha))
     d.line((x - size, y, x + size, y), fill=c, width=1)
     d.line((x, y - size, x, y + size), fill=c, width=1)
 
 
-def _draw_tiny_note(d, x, y, size, alpha):
+def _draw_tiny_note(d, x, y, size, c):
     """Draw a tiny music note."""
-    c = (255, 200, 220, max(60, alpha))
     d.ellipse((x, y, x + size, y + size - 1), fill=c)
     d.line((x + size, y - size, x + size, y + 1), fill=c, width=1)
+
+
+_HEART_RGB = (255, 120, 150)
+_SPARKLE_RGB = (255, 255, 200)
+_NOTE_RGB = (255, 200, 220)
+
+# Particle kind -> (draw function, base colour), indexed by _PARTICLE_KINDS
+_PARTICLE_KINDS = {"heart": 0, "sparkle": 1, "note": 2}
+_PARTICLE_DRAW = (
+    (_draw_tiny_heart, _HEART_RGB),
+    (_draw_tiny_sparkle, _SPARKLE_RGB),
+    (_draw_tiny_note, _NOTE_RGB),
+)
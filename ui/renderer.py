@@ -15,6 +15,7 @@ from ui.framework import (
     hint_for_status,
     infer_turn,
     pulse,
+    text_bbox,
 )
 from ui.pig_sprites import PigSpriteSheet, sprite_mood_for_status
 from ui.utils import ColorUtils, ImageUtils, TextUtils
@@ -23,6 +24,7 @@ from ui.utils import ColorUtils, ImageUtils, TextUtils
 class DisplayState:
     def __init__(self):
         self._lock = threading.Lock()
+        self._changed = threading.Event()  # set by update(), cleared by snapshot()
         self.turn = "sleep"  # "green" | "red" | "amber" | "sleep" | "paused"
         self.status = "Hello"
         self.emoji = "🐷"
@@ -79,19 +81,29 @@ class DisplayState:
                 self.image_obj = None
             if "game_surface" in kwargs:
                 self.game_surface = kwargs["game_surface"]
+            self._changed.set()
 
     def snapshot(self):
         with self._lock:
+            self._changed.clear()
             s = copy.copy(self)
-        # Don't copy the lock into the snapshot
+        # Don't copy the lock or event into the snapshot
         s._lock = None
+        s._changed = None
         return s
 
+    def wait_for_update(self, timeout):
+        """Block until update() is called after the last snapshot, or timeout."""
+        return self._changed.wait(timeout)
+
 
 display_state = DisplayState()
 
 
 class RenderThread(threading.Thread):
+    # Never redraw faster than this, however quickly updates arrive
+    MIN_FRAME_SEC = 1.0 / 60
+
     def __init__(self, board, font_path, fps=30):
         super().__init__(daemon=True)
         self.board = board
@@ -147,11 +159,18 @@ class RenderThread(threading.Thread):
     def run(self):
         interval = 1.0 / self.fps
         while self.running:
+            frame_start = time.monotonic()
             try:
                 self._render_frame()
             except Exception as e:
                 print(f"[Render] Error: {e}")
-            time.sleep(interval)
+            # Animations tick at fps; a state update cuts the wait short so
+            # bursts of updates land in the next frame, capped at 60 Hz
+            elapsed = time.monotonic() - frame_start
+            if elapsed < self.MIN_FRAME_SEC:
+                time.sleep(self.MIN_FRAME_SEC - elapsed)
+                elapsed = self.MIN_FRAME_SEC
+            display_state.wait_for_update(interval - elapsed)
 
     def stop(self):
         self.running = False
@@ -288,7 +307,7 @@ class RenderThread(threading.Thread):
             fill=theme.text_soft,
         )
 
-        self._render_status_glow(draw, image, width, mood)
+        self._render_status_glow(draw, image, width, mood, now)
 
         # --- Pig sprite instead of emoji ---
         sprite_mood = sprite_mood_for_status(state.status)
@@ -298,28 +317,28 @@ class RenderThread(threading.Thread):
         # Center horizontally, animate vertically with breathing/bobbing
         pig_x = (width - pig_w) // 2
         pig_y_base = (image.height - pig_h) // 2 + 2  # slight offset down
-        pig_y_anim = self._pig_y_for_anim(mood.anim_style)
+        pig_y_anim = self._pig_y_for_anim(mood.anim_style, now)
         pig_y = pig_y_base + pig_y_anim
 
         image.paste(pig_frame, (pig_x, pig_y), pig_frame)
 
         self._render_battery(draw, state, width)
 
-    def _pig_y_for_anim(self, anim_style: str) -> int:
+    def _pig_y_for_anim(self, anim_style: str, now: float) -> int:
         """Vertical animation offset for the pig sprite."""
         if anim_style == "listen_pulse":
-            return int(pulse(-1, 2, speed=3.2))
+            return int(pulse(-1, 2, speed=3.2, now=now))
         if anim_style == "talk_bob":
-            return int(pulse(-2, 3, speed=4.0))
+            return int(pulse(-2, 3, speed=4.0, now=now))
         if anim_style == "celebrate":
-            return int(pulse(-3, 4, speed=4.8))
+            return int(pulse(-3, 4, speed=4.8, now=now))
         if anim_style == "think_blink":
-            return int(pulse(-1, 1, speed=1.8))
+            return int(pulse(-1, 1, speed=1.8, now=now))
         # idle_breathe: gentle
-        return int(pulse(-1, 1, speed=1.0))
+        return int(pulse(-1, 1, speed=1.0, now=now))
 
-    def _render_status_glow(self, draw, image, width, mood):
-        amt = pulse(0.2, 1.0, speed=1.8)
+    def _render_status_glow(self, draw, image, width, mood, now):
+        amt = pulse(0.2, 1.0, speed=1.8, now=now)
         r, g, b = mood.accent_shift
         color = (min(255, int(120 + r * amt)), min(255, int(90 + g * amt)), min(255, int(120 + b * amt)), 255)
         y = image.height - 8
@@ -396,7 +415,7 @@ class RenderThread(threading.Thread):
         txt = str(state.battery_level)
         lum = ColorUtils.luminance(fill)
         txt_color = "black" if lum > 128 else "white"
-        tb = self.battery_font.getbbox(txt)
+        tb = text_bbox(self.battery_font, txt)
         tw = tb[2] - tb[0]
         tx = bx + (bw - tw) // 2
         ty = by + 1
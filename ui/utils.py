@@ -1,5 +1,6 @@
 import os
 import unicodedata
+from functools import lru_cache
 from io import BytesIO
 
 import numpy as np
@@ -48,13 +49,25 @@ class ImageUtils:
         rgb565 = (r << 11) | (g << 5) | b
         high = (rgb565 >> 8).astype(np.uint8)
         low = (rgb565 & 0xFF).astype(np.uint8)
-        return np.dstack((high, low)).flatten().tolist()
+        return np.dstack((high, low)).tobytes()
+
+
+# The only ASCII characters in categories So/Sk
+_ASCII_EMOJI = frozenset("^`")
+
+
+@lru_cache(maxsize=4096)
+def _is_symbol(char):
+    return unicodedata.category(char) in ("So", "Sk") or ord(char) > 0x1F000
 
 
 class EmojiUtils:
     @staticmethod
     def is_emoji(char):
-        return unicodedata.category(char) in ("So", "Sk") or ord(char) > 0x1F000
+        # ASCII is most of the text; answer it without the category lookup
+        if char < "\x80":
+            return char in _ASCII_EMOJI
+        return _is_symbol(char)
 
     @staticmethod
     def emoji_to_filename(char):